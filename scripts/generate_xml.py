@@ -2,7 +2,7 @@
 """Script to generate XML from a BibTeX entry."""
 
 import sys
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 from pathlib import Path
 import re
 
@@ -22,14 +22,8 @@ def generate_xml(entry: BibTeXEntry) -> str:
     Returns:
         str: XML representation of the entry
     """
-    # Create root element
-    root = ET.Element("reference")
-    
-    # Add entry type as an attribute
-    root.set("type", entry.entry_type.value)
-    
-    # Add key as an attribute
-    root.set("key", entry.key)
+    # Create root element with entry type and key as attributes
+    root = ET.Element("reference", type=entry.entry_type.value, key=entry.key)
     
     # Add all fields as child elements
     for field_name, field_value in entry.fields.items():
@@ -40,13 +34,11 @@ def generate_xml(entry: BibTeXEntry) -> str:
         # Convert LaTeX accents to Unicode
         field_value_unicode = latex_to_unicode(field_value)
         
-        # Create field element
-        field_elem = ET.SubElement(root, field_name)
-        field_elem.text = field_value_unicode
+        # Create field element; lxml escapes the text during serialization
+        ET.SubElement(root, field_name).text = field_value_unicode
     
     # Convert to string with pretty printing
-    ET.indent(root, space="  ")
-    return ET.tostring(root, encoding="unicode")
+    return ET.tostring(root, pretty_print=True, encoding="unicode")
 
 def main():
     """Main function to demonstrate XML generation."""
@@ -1,7 +1,74 @@
-import os
+import mmap
+import re
 import sys
 from pathlib import Path
-import bibtexparser
+
+# Start of a block: '@', the block type and its opening delimiter. Like
+# bibtexparser, blocks may start anywhere, after indentation or on the
+# same line as the previous block
+_BLOCK_START = re.compile(rb'@[ \t]*([A-Za-z]+)[ \t]*([{(])')
+# Tokens that matter for finding the end of a block
+_TOKENS = re.compile(rb'[{}()"]')
+# Blocks that bibtexparser does not treat as entries
+_NON_ENTRIES = {b'comment', b'string', b'preamble'}
+
+
+def _block_end(data, start, opening):
+    """Find the end of the block whose opening delimiter is at start.
+
+    Braces are balanced, and quoted values at the top level of the block are
+    skipped, so a brace or parenthesis inside "..." does not end the block.
+    """
+    closing = b'}' if opening == b'{' else b')'
+    depth = 0
+    in_quote = False
+    for match in _TOKENS.finditer(data, start + 1):
+        token = match.group()
+        if token == b'{':
+            depth += 1
+        elif token == b'}':
+            if depth:
+                depth -= 1
+            elif closing == b'}' and not in_quote:
+                return match.end()
+        elif token == b'"':
+            if depth == 0:
+                in_quote = not in_quote
+        elif token == b')' and closing == b')' and depth == 0 and not in_quote:
+            return match.end()
+    return len(data)
+
+
+def iter_blocks(data):
+    """Yield the lowercase type and raw bytes of each block in a BibTeX buffer.
+
+    Blocks are found by scanning for '@type{' or '@type(' and balancing
+    delimiters up to the closing one, without parsing the fields.
+    """
+    pos = 0
+    while True:
+        start = _BLOCK_START.search(data, pos)
+        if start is None:
+            return
+        end = _block_end(data, start.end() - 1, start.group(2))
+        yield start.group(1).lower(), data[start.start():end]
+        pos = end
+
+
+def iter_entries(data):
+    """Yield the raw bytes of each entry in a BibTeX buffer.
+
+    Each entry is preceded by the @string blocks that appear before it in
+    the buffer, so that the macros it uses are still defined when the entry
+    is read on its own.
+    """
+    strings = []
+    for block_type, block in iter_blocks(data):
+        if block_type == b'string':
+            strings.append(block + b"\n")
+        elif block_type not in _NON_ENTRIES:
+            yield b"".join(strings) + block
+
 
 # Usage: python split_bibtex_entries.py <input_bibtex> <output_dir>
 def main():
@@ -12,17 +79,19 @@ def main():
     output_dir = Path(sys.argv[2])
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with input_bib.open(encoding="utf-8") as f:
-        bib_database = bibtexparser.load(f)
-
-    for i, entry in enumerate(bib_database.entries, 1):
-        db = bibtexparser.bibdatabase.BibDatabase()
-        db.entries = [entry]
-        entry_str = bibtexparser.dumps(db)
-        out_file = output_dir / f"entry{i}.bibtex"
-        with out_file.open("w", encoding="utf-8") as out:
-            out.write(entry_str)
-    print(f"Wrote {len(bib_database.entries)} entries to {output_dir}")
+    count = 0
+    with input_bib.open("rb") as f:
+        # mmap cannot map an empty file
+        if input_bib.stat().st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for count, entry_bytes in enumerate(iter_entries(data), 1):
+                    try:
+                        entry_bytes.decode("utf-8")
+                    except UnicodeDecodeError:
+                        print(f"Error: entry {count} of {input_bib} is not valid UTF-8", file=sys.stderr)
+                        sys.exit(1)
+                    (output_dir / f"entry{count}.bibtex").write_bytes(entry_bytes + b"\n")
+    print(f"Wrote {count} entries to {output_dir}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,16 +1,23 @@
 """Command-line interface for BibTeX to RFC converter."""
 
-import sys
-from typing import Optional
 import os
+import stat
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext, suppress
+from io import StringIO
+from itertools import chain, islice
+from typing import BinaryIO, Callable, ContextManager, Deque, Iterable, Iterator, List, Optional, TextIO, Tuple
 import logging
 
 import click
-from bibtex2rfcv2.xml_converter import bibtex_entry_to_rfcxml
-from bibtex2rfcv2.parser import parse_bibtex
-from pathlib import Path
+from bibtex2rfcv2.xml_converter import bibtex_entries_to_rfcxml, validate_entry
+from bibtex2rfcv2.parser import iter_bibtex
 from tqdm import tqdm
 from bibtex2rfcv2.kdrfc_converter import bibtex_entry_to_kdrfc
+from bibtex2rfcv2.models import BibTeXEntry
 
 from bibtex2rfcv2 import __version__
 
@@ -18,6 +25,209 @@ from bibtex2rfcv2 import __version__
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Output files are written through a large buffer so that the per-chunk
+# writes of the converters are coalesced into few system calls.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Number of entries handed to a worker process at a time with --jobs
+PARALLEL_CHUNK_SIZE = 256
+
+
+def _open_input(input_file: str) -> ContextManager[TextIO]:
+    """Open the BibTeX input file, where '-' means stdin.
+
+    The file is opened once, and failures are reported with the tool's own
+    "File not found" and "Permission denied" wording and exit status 1.
+
+    Args:
+        input_file: The input path, or '-' for stdin.
+
+    Returns:
+        A context manager for the text stream; stdin is left open on exit.
+    """
+    if input_file == '-':
+        return nullcontext(sys.stdin)
+    try:
+        return open(input_file, encoding='utf-8')
+    except FileNotFoundError:
+        message = f'File not found: {input_file}'
+    except PermissionError:
+        message = f'Permission denied: {input_file} is not readable.'
+    except OSError:
+        message = f'Could not read file: {input_file}'
+    click.echo(f'Error: {message}', err=True)
+    sys.exit(1)
+
+
+@contextmanager
+def _replace_on_success(output_file: str) -> Iterator[BinaryIO]:
+    """Write to a temporary file next to output_file, moved over it on success.
+
+    Entries are converted while they are written, so a bad entry can stop
+    the conversion half way; an existing output file is then left as it was.
+
+    Args:
+        output_file: The path of the output file.
+
+    Yields:
+        The binary stream to write the output to.
+    """
+    target = os.path.realpath(output_file)
+    if os.path.exists(target) and not os.path.isfile(target):
+        # Devices and pipes such as /dev/null cannot be replaced
+        with open(output_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=f'.{os.path.basename(target)}.')
+    try:
+        with open(fd, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+        # mkstemp creates the file private to the user; give it the mode the
+        # output file has, or would get if it were created with open()
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _progress_bar(desc: str, progress: bool) -> tqdm:
+    """Create a progress bar counting processed entries.
+
+    The bar is only shown when enabled and stderr is a terminal. The number
+    of entries is not known up front, as they are consumed while they are
+    converted. The bar is redrawn at most four times a second, and
+    conversion updates it once per chunk of entries.
+
+    Args:
+        desc: The label of the bar.
+        progress: Whether the user asked for a progress bar.
+
+    Returns:
+        The progress bar.
+    """
+    return tqdm(desc=desc, disable=not progress or not sys.stderr.isatty(), mininterval=0.25)
+
+
+def _chunked(entries: Iterable[BibTeXEntry]) -> Iterator[List[BibTeXEntry]]:
+    """Group entries into lists of PARALLEL_CHUNK_SIZE entries.
+
+    Args:
+        entries: The entries to group.
+
+    Yields:
+        Consecutive chunks of entries; the last one may be shorter.
+    """
+    it = iter(entries)
+    while True:
+        chunk = list(islice(it, PARALLEL_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _rfcxml_chunk(entries: List[BibTeXEntry]) -> bytes:
+    """Convert a chunk of entries to UTF-8 encoded RFC XML.
+
+    Runs in a worker process when converting with --jobs.
+
+    Args:
+        entries: The entries to convert.
+
+    Returns:
+        The XML of all entries, each followed by a newline.
+    """
+    return bibtex_entries_to_rfcxml(entries).encode('utf-8')
+
+
+def _kdrfc_chunk(entries: List[BibTeXEntry]) -> bytes:
+    """Convert a chunk of entries to UTF-8 encoded kdrfc YAML.
+
+    Runs in a worker process when converting with --jobs.
+
+    Args:
+        entries: The entries to convert.
+
+    Returns:
+        The YAML of all entries, each followed by a newline.
+    """
+    out = StringIO()
+    for entry in entries:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calling bibtex_entry_to_kdrfc for entry: %s", entry)
+        out.write(bibtex_entry_to_kdrfc(entry))
+        out.write('\n')
+    return out.getvalue().encode('utf-8')
+
+
+def _write_converted(entries: Iterable[BibTeXEntry], out: BinaryIO,
+                     convert_chunk: Callable[[List[BibTeXEntry]], bytes],
+                     jobs: int, progress: bool) -> int:
+    """Convert entries chunk by chunk and write the encoded output to a binary stream.
+
+    Entries are consumed as they go: serial conversion holds one chunk of
+    entries and its output at a time, parallel conversion at most two
+    chunks per worker.
+
+    Args:
+        entries: The entries to convert.
+        out: The binary stream to write to.
+        convert_chunk: Module-level function converting a chunk of entries.
+        jobs: Number of worker processes; 1 converts in this process.
+        progress: Whether to show a progress bar.
+
+    Returns:
+        The number of entries written.
+    """
+    count = 0
+    if jobs > 1:
+        # Chunks are submitted as they are read, with at most two per worker
+        # in flight, and written back in input order
+        pending: Deque[Tuple[int, Future]] = deque()
+        with ProcessPoolExecutor(max_workers=jobs) as pool, \
+                _progress_bar("Converting entries", progress) as bar:
+            for chunk in _chunked(entries):
+                if len(pending) >= 2 * jobs:
+                    size, future = pending.popleft()
+                    out.write(future.result())
+                    bar.update(size)
+                    count += size
+                pending.append((len(chunk), pool.submit(convert_chunk, chunk)))
+            while pending:
+                size, future = pending.popleft()
+                out.write(future.result())
+                bar.update(size)
+                count += size
+    else:
+        with _progress_bar("Converting entries", progress) as bar:
+            for chunk in _chunked(entries):
+                out.write(convert_chunk(chunk))
+                bar.update(len(chunk))
+                count += len(chunk)
+    return count
+
+
+def _peek_entries(entries: Iterator[BibTeXEntry]) -> Optional[Iterator[BibTeXEntry]]:
+    """Check whether an entry iterator yields anything, without losing the first entry.
+
+    Args:
+        entries: The entries to check.
+
+    Returns:
+        An iterator over all the entries, or None if there are none.
+    """
+    first = next(entries, None)
+    if first is None:
+        return None
+    return chain([first], entries)
+
 
 @click.group()
 @click.version_option(version=__version__)
@@ -28,45 +238,48 @@ def main() -> None:
 
 @main.command()
 @click.argument("input_file")
-@click.argument("output_file")
+@click.argument("output_file", required=False)
 @click.option("--progress/--no-progress", default=True, help="Show progress bar")
-def to_xml(input_file: str, output_file: str, progress: bool) -> None:
+@click.option("--jobs", "-j", default=1, type=click.IntRange(min=1),
+              help="Number of worker processes used to parse and convert entries")
+@click.option("--validate-only", is_flag=True,
+              help="Only check that entries can be converted; no output is written")
+def to_xml(input_file: str, output_file: Optional[str], progress: bool, jobs: int,
+           validate_only: bool) -> None:
     """Convert a BibTeX file to RFC XML format.
     
     Use '-' for input_file to read from stdin.
-    Use '-' for output_file to write to stdout.
+    Use '-' for output_file to write to stdout (always converted serially).
+    output_file may be omitted with --validate-only.
     """
+    if output_file is None and not validate_only:
+        raise click.UsageError("Missing argument 'OUTPUT_FILE'.")
     try:
         # Handle stdin
-        if input_file == '-':
-            entries = parse_bibtex(sys.stdin)
-        else:
-            # Custom permission check
-            if not os.path.exists(input_file):
-                click.echo(f'Error: File not found: {input_file}', err=True)
-                sys.exit(1)
-            if not os.access(input_file, os.R_OK):
-                click.echo(f'Error: Permission denied: {input_file} is not readable.', err=True)
-                sys.exit(1)
-            entries = parse_bibtex(Path(input_file))
-
-        if not entries:
+        with _open_input(input_file) as source:
+            entries = _peek_entries(iter_bibtex(source, jobs))
+
+        if entries is None:
             click.echo('Warning: No BibTeX entries found in input.', err=True)
             sys.exit(0)
 
+        if validate_only:
+            count = 0
+            with _progress_bar("Validating entries", progress) as bar:
+                for entry in entries:
+                    validate_entry(entry)
+                    bar.update()
+                    count += 1
+            click.echo(f'Validation completed. {count} entries can be converted.', err=True)
+            return
+
         # Handle stdout
         if output_file == '-':
-            for entry in tqdm(entries, desc="Converting entries", disable=not progress):
-                logger.info("Calling bibtex_entry_to_rfcxml for entry: %s", entry)
-                xml = bibtex_entry_to_rfcxml(entry)
-                click.echo(xml)
+            _write_converted(entries, click.get_binary_stream('stdout'), _rfcxml_chunk, 1, progress)
         else:
-            with open(output_file, 'w') as f:
-                for entry in tqdm(entries, desc="Converting entries", disable=not progress):
-                    logger.info("Calling bibtex_entry_to_rfcxml for entry: %s", entry)
-                    xml = bibtex_entry_to_rfcxml(entry)
-                    f.write(xml + '\n')
-            click.echo(f'Conversion completed. {len(entries)} entries written to {output_file}.', err=True)
+            with _replace_on_success(output_file) as f:
+                count = _write_converted(entries, f, _rfcxml_chunk, jobs, progress)
+            click.echo(f'Conversion completed. {count} entries written to {output_file}.', err=True)
     except Exception as e:
         click.echo(f'Error: {e}', err=True)
         sys.exit(1)
@@ -76,31 +289,24 @@ def to_xml(input_file: str, output_file: str, progress: bool) -> None:
 @click.argument("input_file")
 @click.argument("output_file")
 @click.option("--progress/--no-progress", default=True, help="Show progress bar")
-def to_kdrfc(input_file: str, output_file: str, progress: bool) -> None:
+@click.option("--jobs", "-j", default=1, type=click.IntRange(min=1),
+              help="Number of worker processes used to parse and convert entries")
+def to_kdrfc(input_file: str, output_file: str, progress: bool, jobs: int) -> None:
     """Convert a BibTeX file to kdrfc format.
     
     Use '-' for input_file to read from stdin.
-    Use '-' for output_file to write to stdout.
+    Use '-' for output_file to write to stdout (always converted serially).
     """
     try:
         # Handle stdin
         if input_file == '-':
             logger.info("Reading from stdin.")
-            entries = parse_bibtex(sys.stdin)
         else:
-            # Custom permission check
-            if not os.path.exists(input_file):
-                logger.error(f'Error: File not found: {input_file}')
-                click.echo(f'Error: File not found: {input_file}', err=True)
-                sys.exit(1)
-            if not os.access(input_file, os.R_OK):
-                logger.error(f'Error: Permission denied: {input_file} is not readable.')
-                click.echo(f'Error: Permission denied: {input_file} is not readable.', err=True)
-                sys.exit(1)
             logger.info(f"Reading from file: {input_file}")
-            entries = parse_bibtex(Path(input_file))
+        with _open_input(input_file) as source:
+            entries = _peek_entries(iter_bibtex(source, jobs))
 
-        if not entries:
+        if entries is None:
             logger.warning('No BibTeX entries found in input.')
             click.echo('Warning: No BibTeX entries found in input.', err=True)
             sys.exit(0)
@@ -108,19 +314,12 @@ def to_kdrfc(input_file: str, output_file: str, progress: bool) -> None:
         # Handle stdout
         if output_file == '-':
             logger.info("Writing to stdout.")
-            for entry in tqdm(entries, desc="Converting entries", disable=not progress):
-                logger.info("Calling bibtex_entry_to_kdrfc for entry: %s", entry)
-                yaml = bibtex_entry_to_kdrfc(entry)
-                click.echo(yaml)
+            _write_converted(entries, click.get_binary_stream('stdout'), _kdrfc_chunk, 1, progress)
         else:
             logger.info(f"Writing to file: {output_file}")
-            with open(output_file, 'w') as f:
-                for entry in tqdm(entries, desc="Converting entries", disable=not progress):
-                    logger.info("Calling bibtex_entry_to_kdrfc for entry: %s", entry)
-                    yaml = bibtex_entry_to_kdrfc(entry)
-                    f.write(yaml + '\n')
-            click.echo(f'Conversion completed. {len(entries)} entries written to {output_file}.', err=True)
-            print(f"Output of to-kdrfc command: {yaml}")
+            with _replace_on_success(output_file) as f:
+                count = _write_converted(entries, f, _kdrfc_chunk, jobs, progress)
+            click.echo(f'Conversion completed. {count} entries written to {output_file}.', err=True)
     except Exception as e:
         logger.error(f"Conversion failed: {e}")
         click.echo(f'Error: {e}', err=True)
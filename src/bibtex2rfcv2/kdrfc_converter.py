@@ -1,18 +1,82 @@
 """Converter from BibTeXEntry to kdrfc format using YAML for references."""
 
-import logging
+import json
+import re
 import yaml
-from typing import Optional, Any, Dict, List, TextIO, Union
+from typing import Any, Callable, Dict, Optional, Tuple
 from bibtex2rfcv2.models import BibTeXEntry, BibTeXEntryType
-from typing import Optional, Any
-from bibtex2rfcv2.models import BibTeXEntry
 from bibtex2rfcv2.error_handling import InvalidInputError, ConversionError, logger
-from bibtex2rfcv2.utils import latex_to_unicode
+
+# Use libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper
+    logger.warning("PyYAML was built without libyaml; kdrfc output uses the slower pure-Python emitter")
+
+# Strings that YAML reads back as the same string when written unquoted
+_PLAIN_SCALAR = re.compile(r'[^\W\d_][\w .,/()-]*')
+# Words YAML 1.1 reads as booleans or null
+_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+# Characters JSON leaves as they are but YAML needs escaped in quoted strings
+_YAML_UNSAFE = re.compile('[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]')
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a string or integer as a YAML scalar.
+
+    Raises:
+        TypeError: For any other type; the caller falls back to yaml.dump.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    if not isinstance(value, str):
+        raise TypeError(f"Unsupported YAML value: {value!r}")
+    if _PLAIN_SCALAR.fullmatch(value) and value[-1] != " " and value.lower() not in _RESERVED_WORDS:
+        return value
+    # A JSON string is a valid YAML double-quoted scalar
+    return _YAML_UNSAFE.sub(lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False))
+
+def _emit_kdrfc_yaml(key: str, ref: Dict[str, Any]) -> str:
+    """Write a kdrfc reference as YAML without going through yaml.dump.
+
+    Only handles the shape bibtex_entry_to_kdrfc builds: scalars, the date
+    mapping and the list of author mappings. Keys are sorted, as yaml.dump
+    does by default. The reference is still collected in a dict first, so
+    the yaml.dump fallback and the key order do not depend on the order in
+    which fields were added.
+
+    Raises:
+        TypeError: If a value is not a string or integer.
+    """
+    lines = [f"{_yaml_scalar(key)}:"]
+    for name, value in sorted(ref.items()):
+        if isinstance(value, dict):
+            lines.append(f"  {name}:")
+            lines.extend(f"    {k}: {_yaml_scalar(v)}" for k, v in sorted(value.items()))
+        elif isinstance(value, list):
+            lines.append(f"  {name}:")
+            for item in value:
+                if not isinstance(item, dict):
+                    lines.append(f"  - {_yaml_scalar(item)}")
+                    continue
+                prefix = "  - "
+                for k, v in sorted(item.items()):
+                    lines.append(f"{prefix}{k}: {_yaml_scalar(v)}")
+                    prefix = "    "
+        else:
+            lines.append(f"  {name}: {_yaml_scalar(value)}")
+    lines.append("")
+    return "\n".join(lines)
 
 def _try_convert_to_int(value: str) -> Any:
     """Try to convert a string to an integer, return original string if conversion fails."""
+    # Anything int() accepts starts with a sign or a digit, so most
+    # non-numeric values are rejected without raising ValueError
+    stripped = value.strip()
+    if not stripped or not (stripped[0].isdecimal() or stripped[0] in '+-'):
+        return value
     try:
-        return int(value)
+        return int(stripped)
     except ValueError:
         return value
 
@@ -35,14 +99,6 @@ def _field_to_str(val):
     else:
         return str(val)
 
-def _convert_author_name(name: str) -> str:
-    """Convert author name from 'Last, First' to 'First Last' format."""
-    name = name.strip()
-    if ', ' in name:
-        parts = name.split(', ', 1)
-        return parts[1] + ' ' + parts[0]
-    return name
-
 def _flatten_to_str(val):
     """Recursively flatten lists and join all string elements with a space."""
     if isinstance(val, list):
@@ -54,6 +110,39 @@ def _flatten_to_str(val):
     else:
         return str(val)
 
+def _field_to_int(val):
+    """Convert a BibTeX field value to an integer where it is one."""
+    return _try_convert_to_int(_field_to_str(val))
+
+# Fields of all entry types, each with the conversion applied to it
+_COMMON_FIELDS = (
+    ("url", _field_to_str),
+    ("doi", _field_to_str),
+    ("abstract", _field_to_str),
+    ("note", _field_to_str),
+    ("publisher", _field_to_str),
+    ("number", _field_to_int),
+)
+
+# Fields of their own per entry type, each with the conversion applied to it
+_ARTICLE_FIELDS = (("journal", None), ("volume", _try_convert_to_int), ("pages", None))
+_BOOK_FIELDS = (("edition", _try_convert_to_int), ("isbn", None))
+_PROCEEDINGS_FIELDS = (("booktitle", None), ("pages", None), ("editor", _field_to_str))
+_REPORT_FIELDS = (("institution", None),)
+_THESIS_FIELDS = (("school", None),)
+_TYPE_FIELDS: Dict[BibTeXEntryType, Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]] = {
+    BibTeXEntryType.ARTICLE: _ARTICLE_FIELDS,
+    BibTeXEntryType.BOOK: _BOOK_FIELDS,
+    BibTeXEntryType.CONFERENCE: _PROCEEDINGS_FIELDS,
+    BibTeXEntryType.INPROCEEDINGS: _PROCEEDINGS_FIELDS,
+    BibTeXEntryType.PROCEEDINGS: _PROCEEDINGS_FIELDS,
+    BibTeXEntryType.TECHREPORT: _REPORT_FIELDS,
+    BibTeXEntryType.REPORT: _REPORT_FIELDS,
+    BibTeXEntryType.MASTERSTHESIS: _THESIS_FIELDS,
+    BibTeXEntryType.PHDTHESIS: _THESIS_FIELDS,
+    BibTeXEntryType.THESIS: _THESIS_FIELDS,
+}
+
 def bibtex_entry_to_kdrfc(entry: BibTeXEntry) -> str:
     """Convert a BibTeXEntry to kdrfc format using YAML for references.
 
@@ -67,243 +156,62 @@ def bibtex_entry_to_kdrfc(entry: BibTeXEntry) -> str:
         InvalidInputError: If required fields are missing.
         ConversionError: If conversion fails unexpectedly.
     """
-    logger.info(f"Converting entry: {entry.key} of type {entry.entry_type}")
-    if not entry.fields.get("author") and not entry.fields.get("editor") or not entry.fields.get("title"):
+    logger.debug("Converting entry: %s of type %s", entry.key, entry.entry_type)
+    # Title first: it is the field degenerate entries most often lack
+    fields = entry.fields
+    if not fields.get("title") or not (fields.get("author") or fields.get("editor")):
         logger.error("Missing required fields: author or editor, and title")
         raise InvalidInputError("Missing required fields: author or editor, and title")
     try:
+        # Bound once; every field below is read through it
+        get = entry.get_field
+
         # Preserve line breaks in title
-        title = entry.get_field("title") or "Untitled"
+        title = get("title") or "Untitled"
         title = _flatten_to_str(title).replace("\\n", "\n")
         if not title:
             title = "Untitled"
         
-        # Get authors
-        authors = []
-        author_field = entry.get_field('author')
-        if author_field:
-            if isinstance(author_field, list):
-                # If it's already a list, process each name
-                for name in author_field:
-                    # Remove outer braces and convert LaTeX to Unicode
-                    name = name.strip('{}')
-                    name = latex_to_unicode(name)
-                    
-                    # Convert "Last, First" to "First Last"
-                    if ', ' in name:
-                        parts = name.split(', ', 1)
-                        name = parts[1] + ' ' + parts[0]
-                    
-                    # Clean up whitespace
-                    name = ' '.join(name.split())
-                    if name:
-                        authors.append(name)
-            else:
-                # Split on ' and ' but not within braces
-                author_names = []
-                current = ""
-                brace_level = 0
-                for char in author_field:
-                    if char == '{':
-                        brace_level += 1
-                    elif char == '}':
-                        brace_level -= 1
-                    elif char == 'a' and brace_level == 0 and current.endswith(' '):
-                        # Check for ' and ' pattern
-                        if current.endswith(' and '):
-                            author_names.append(current[:-5].strip())
-                            current = ""
-                            continue
-                    current += char
-                if current:
-                    author_names.append(current.strip())
-                
-                # Process each author name
-                for name in author_names:
-                    # Remove outer braces and convert LaTeX to Unicode
-                    name = name.strip('{}')
-                    name = latex_to_unicode(name)
-                    
-                    # Convert "Last, First" to "First Last"
-                    if ', ' in name:
-                        parts = name.split(', ', 1)
-                        name = parts[1] + ' ' + parts[0]
-                    
-                    # Clean up whitespace
-                    name = ' '.join(name.split())
-                    if name:
-                        authors.append(name)
-        
-        # If no authors found, try editors
-        if not authors:
-            editor_field = entry.get_field('editor')
-            if editor_field:
-                if isinstance(editor_field, list):
-                    # If it's already a list, process each name
-                    for name in editor_field:
-                        # Remove outer braces and convert LaTeX to Unicode
-                        name = name.strip('{}')
-                        name = latex_to_unicode(name)
-                        
-                        # Convert "Last, First" to "First Last"
-                        if ', ' in name:
-                            parts = name.split(', ', 1)
-                            name = parts[1] + ' ' + parts[0]
-                        
-                        # Clean up whitespace
-                        name = ' '.join(name.split())
-                        if name:
-                            authors.append(name)
-                else:
-                    # Split on ' and ' but not within braces
-                    editor_names = []
-                    current = ""
-                    brace_level = 0
-                    for char in editor_field:
-                        if char == '{':
-                            brace_level += 1
-                        elif char == '}':
-                            brace_level -= 1
-                        elif char == 'a' and brace_level == 0 and current.endswith(' '):
-                            # Check for ' and ' pattern
-                            if current.endswith(' and '):
-                                editor_names.append(current[:-5].strip())
-                                current = ""
-                                continue
-                        current += char
-                    if current:
-                        editor_names.append(current.strip())
-                    
-                    # Process each editor name
-                    for name in editor_names:
-                        # Remove outer braces and convert LaTeX to Unicode
-                        name = name.strip('{}')
-                        name = latex_to_unicode(name)
-                        
-                        # Convert "Last, First" to "First Last"
-                        if ', ' in name:
-                            parts = name.split(', ', 1)
-                            name = parts[1] + ' ' + parts[0]
-                        
-                        # Clean up whitespace
-                        name = ' '.join(name.split())
-                        if name:
-                            authors.append(name)
-        
-        # If still no authors, use "Unknown"
-        if not authors:
-            authors = ["Unknown"]
+        # Authors, falling back to editors
+        authors = entry.get_authors() or entry.get_editors() or ["Unknown"]
 
-        # Build a dictionary structure for YAML
-        yaml_dict = {
-            entry.key: {
-                "title": title,
-                "author": [{"ins": author, "name": author} for author in authors]
-            }
+        # Build the reference; it is keyed by the entry key when dumped
+        ref = {
+            "title": title,
+            "author": [{"ins": author, "name": author} for author in authors]
         }
 
         # Add date information
-        year = entry.get_field("year")
-        month = entry.get_field("month")
+        year = get("year")
+        month = get("month")
         if year:
             date_dict = {"year": _try_convert_to_int(year)}
             if month:
                 date_dict["month"] = month
-            yaml_dict[entry.key]["date"] = date_dict
+            ref["date"] = date_dict
 
         # Add entry type specific fields
-        if entry.entry_type == "article":
-            journal = entry.get_field("journal")
-            volume = entry.get_field("volume")
-            number = entry.get_field("number")
-            pages = entry.get_field("pages")
-            publisher = entry.get_field("publisher")
-            if journal:
-                yaml_dict[entry.key]["journal"] = journal
-            if volume:
-                yaml_dict[entry.key]["volume"] = _try_convert_to_int(volume)
-            if number:
-                yaml_dict[entry.key]["number"] = _try_convert_to_int(number)
-            if pages:
-                yaml_dict[entry.key]["pages"] = pages
-            if publisher:
-                yaml_dict[entry.key]["publisher"] = publisher
-        elif entry.entry_type == "book":
-            publisher = entry.get_field("publisher")
-            edition = entry.get_field("edition")
-            isbn = entry.get_field("isbn")
-            if publisher:
-                yaml_dict[entry.key]["publisher"] = publisher
-            if edition:
-                yaml_dict[entry.key]["edition"] = _try_convert_to_int(edition)
-            if isbn:
-                yaml_dict[entry.key]["isbn"] = isbn
-        elif entry.entry_type in ["conference", "inproceedings", "proceedings"]:
-            booktitle = entry.get_field("booktitle")
-            publisher = entry.get_field("publisher")
-            pages = entry.get_field("pages")
-            editors = entry.get_field("editor")
-            if booktitle:
-                yaml_dict[entry.key]["booktitle"] = booktitle
-            if publisher:
-                yaml_dict[entry.key]["publisher"] = publisher
-            if pages:
-                yaml_dict[entry.key]["pages"] = pages
-            if editors:
-                editors_str = _field_to_str(editors)
-                yaml_dict[entry.key]["editor"] = editors_str
-        elif entry.entry_type == "techreport":
-            institution = entry.get_field("institution")
-            number = entry.get_field("number")
-            publisher = entry.get_field("publisher")
-            if institution:
-                yaml_dict[entry.key]["institution"] = institution
-            if number:
-                yaml_dict[entry.key]["number"] = _try_convert_to_int(number)
-            if publisher:
-                yaml_dict[entry.key]["publisher"] = publisher
-        elif entry.entry_type in ["mastersthesis", "phdthesis", "thesis"]:
-            school = entry.get_field("school")
-            if school:
-                yaml_dict[entry.key]["school"] = school
-
-        # Add common optional fields
-        url = entry.get_field("url")
-        doi = entry.get_field("doi")
-        abstract = entry.get_field("abstract")
-        note = entry.get_field("note")
-        publisher = entry.get_field("publisher")
-        number = entry.get_field("number")
-        editor = entry.get_field("editor")
+        for name, convert in _TYPE_FIELDS.get(entry.entry_type, ()):
+            value = get(name)
+            if value:
+                ref[name] = convert(value) if convert else value
 
-        if url:
-            url_str = _field_to_str(url)
-            logger.debug(f"url field type: {type(url_str)}, value: {url_str}")
-            yaml_dict[entry.key]["url"] = url_str
-        if doi:
-            doi_str = _field_to_str(doi)
-            logger.debug(f"doi field type: {type(doi_str)}, value: {doi_str}")
-            yaml_dict[entry.key]["doi"] = doi_str
-        if abstract:
-            abstract_str = _field_to_str(abstract)
-            logger.debug(f"abstract field type: {type(abstract_str)}, value: {abstract_str}")
-            yaml_dict[entry.key]["abstract"] = abstract_str
-        if note:
-            note_str = _field_to_str(note)
-            logger.debug(f"note field type: {type(note_str)}, value: {note_str}")
-            yaml_dict[entry.key]["note"] = note_str
-        if publisher:
-            publisher_str = _field_to_str(publisher)
-            logger.debug(f"publisher field type: {type(publisher_str)}, value: {publisher_str}")
-            yaml_dict[entry.key]["publisher"] = publisher_str
-        if number:
-            num_str = _field_to_str(number)
-            logger.debug(f"number field type: {type(num_str)}, value: {num_str}")
-            yaml_dict[entry.key]["number"] = _try_convert_to_int(num_str)
+        # Add common optional fields; publisher and number are read only
+        # here, as they apply to all entry types
+        for name, convert in _COMMON_FIELDS:
+            value = get(name)
+            if value:
+                value = convert(value)
+                logger.debug("%s field type: %s, value: %s", name, type(value), value)
+                ref[name] = value
 
         # Serialize the dictionary to YAML text
-        yaml_output = yaml.dump(yaml_dict, default_flow_style=False)
-        logger.info(f"Generated YAML output: {yaml_output}")
+        try:
+            yaml_output = _emit_kdrfc_yaml(entry.key, ref)
+        except TypeError:
+            # Values outside the kdrfc schema, e.g. unusual parsed field types
+            yaml_output = yaml.dump({entry.key: ref}, Dumper=_YAMLDumper, default_flow_style=False)
+        logger.debug("Generated YAML output: %s", yaml_output)
         return yaml_output
     except Exception as e:
         logger.error(f"Conversion failed: {e}")
@@ -1,12 +1,88 @@
 """Data models for BibTeX entries and RFC references."""
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Any, Union
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Any, Union
 from bibtex2rfcv2.error_handling import InvalidInputError
 from bibtex2rfcv2.utils import latex_to_unicode
 import re
 
+# Removes braces from field values and joins multiline values
+_FIELD_CLEANUP = str.maketrans({"{": None, "}": None, "\n": " "})
+# Valid year field value
+_YEAR_RE = re.compile(r'\d{4}')
+# Separator between names in author/editor fields
+_AND_RE = re.compile(r'\s+and\s+')
+# Separator not followed by a closing brace before the next opening one, i.e.
+# outside of braces; only reliable when brace groups are not nested
+_AND_OUTSIDE_BRACES_RE = re.compile(r'\s+and\s+(?![^{}]*\})')
+# An opening brace inside another brace group
+_NESTED_BRACE_RE = re.compile(r'\{[^}]*\{')
+# Braces and name separators, scanned to split only outside of braces
+_AND_OR_BRACE_RE = re.compile(r'[{}]|\s+and\s+')
+
+
+def _split_names(field_value: str) -> List[str]:
+    """Split an author/editor field on ' and ' outside of braces.
+
+    Every path leaves the character scanning to compiled regular expressions;
+    only the nested-brace case visits the matches in Python.
+
+    Args:
+        field_value: The raw field value.
+
+    Returns:
+        The individual names, unprocessed.
+    """
+    if '{' not in field_value:
+        # No braces to protect an ' and ', so split in a single regex pass
+        return _AND_RE.split(field_value)
+    if not _NESTED_BRACE_RE.search(field_value):
+        return _AND_OUTSIDE_BRACES_RE.split(field_value)
+    # Nested braces: track the brace level explicitly
+    names = []
+    start = 0
+    brace_level = 0
+    for match in _AND_OR_BRACE_RE.finditer(field_value):
+        token = match.group()
+        if token == '{':
+            brace_level += 1
+        elif token == '}':
+            brace_level -= 1
+        elif brace_level == 0:
+            names.append(field_value[start:match.start()])
+            start = match.end()
+    names.append(field_value[start:])
+    return names
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Normalize a single author/editor name to "First Last" format.
+
+    The same authors appear across many entries, so results are memoized.
+
+    Args:
+        name: The name as split from the field.
+
+    Returns:
+        The cleaned up name, empty if nothing is left.
+    """
+    # Remove outer braces and convert LaTeX to Unicode; plain names, which
+    # includes every name already run through the parser's convert_to_unicode,
+    # have nothing to convert. Only the outer braces go here: inner ones
+    # delimit accent arguments and are translated away by latex_to_unicode
+    name = name.strip('{}')
+    if '\\' in name or '{' in name or '}' in name:
+        name = latex_to_unicode(name)
+    # Convert "Last, First" to "First Last"
+    last, sep, first = name.partition(', ')
+    if sep:
+        name = f"{first} {last}"
+    # Clean up whitespace; for names this short, split/join beats re.sub
+    return ' '.join(name.split())
+
 
 class BibTeXEntryType(str, Enum):
     """Standard BibTeX entry types."""
@@ -37,44 +113,89 @@ class BibTeXEntryType(str, Enum):
 
 
 # Required fields for each entry type
-REQUIRED_FIELDS: Dict[BibTeXEntryType, Set[str]] = {
-    BibTeXEntryType.ARTICLE: {"author", "title", "journal", "year"},
-    BibTeXEntryType.BOOK: {"author", "title", "publisher", "year"},
-    BibTeXEntryType.INBOOK: {"author", "title", "chapter", "publisher", "year"},
-    BibTeXEntryType.BOOKLET: {"title"},
-    BibTeXEntryType.CONFERENCE: {"author", "title", "booktitle", "year"},
-    BibTeXEntryType.INPROCEEDINGS: {"author", "title", "booktitle", "year"},
-    BibTeXEntryType.MANUAL: {"title"},
-    BibTeXEntryType.MASTERSTHESIS: {"author", "title", "school", "year"},
-    BibTeXEntryType.MISC: set(),
-    BibTeXEntryType.PHDTHESIS: {"author", "title", "school", "year"},
-    BibTeXEntryType.PROCEEDINGS: {"title", "year"},
-    BibTeXEntryType.TECHREPORT: {"author", "title", "institution", "year"},
-    BibTeXEntryType.UNPUBLISHED: {"author", "title", "note"},
-    BibTeXEntryType.ONLINE: {"title", "url"},
-    BibTeXEntryType.PATENT: {"author", "title", "number"},
-    BibTeXEntryType.PERIODICAL: {"title", "year"},
-    BibTeXEntryType.SUPPPERIODICAL: {"author", "title", "journal", "year"},
-    BibTeXEntryType.INCOLLECTION: {"author", "title", "booktitle", "publisher", "year"},
-    BibTeXEntryType.INREFERENCE: {"author", "title", "booktitle", "year"},
-    BibTeXEntryType.REPORT: {"author", "title", "institution", "year"},
-    BibTeXEntryType.SOFTWARE: {"title"},
-    BibTeXEntryType.STANDARD: {"title", "organization"},
-    BibTeXEntryType.THESIS: {"author", "title", "school", "year"},
+REQUIRED_FIELDS: Dict[BibTeXEntryType, FrozenSet[str]] = {
+    BibTeXEntryType.ARTICLE: frozenset({"author", "title", "journal", "year"}),
+    BibTeXEntryType.BOOK: frozenset({"author", "title", "publisher", "year"}),
+    BibTeXEntryType.INBOOK: frozenset({"author", "title", "chapter", "publisher", "year"}),
+    BibTeXEntryType.BOOKLET: frozenset({"title"}),
+    BibTeXEntryType.CONFERENCE: frozenset({"author", "title", "booktitle", "year"}),
+    BibTeXEntryType.INPROCEEDINGS: frozenset({"author", "title", "booktitle", "year"}),
+    BibTeXEntryType.MANUAL: frozenset({"title"}),
+    BibTeXEntryType.MASTERSTHESIS: frozenset({"author", "title", "school", "year"}),
+    BibTeXEntryType.MISC: frozenset(),
+    BibTeXEntryType.PHDTHESIS: frozenset({"author", "title", "school", "year"}),
+    BibTeXEntryType.PROCEEDINGS: frozenset({"title", "year"}),
+    BibTeXEntryType.TECHREPORT: frozenset({"author", "title", "institution", "year"}),
+    BibTeXEntryType.UNPUBLISHED: frozenset({"author", "title", "note"}),
+    BibTeXEntryType.ONLINE: frozenset({"title", "url"}),
+    BibTeXEntryType.PATENT: frozenset({"author", "title", "number"}),
+    BibTeXEntryType.PERIODICAL: frozenset({"title", "year"}),
+    BibTeXEntryType.SUPPPERIODICAL: frozenset({"author", "title", "journal", "year"}),
+    BibTeXEntryType.INCOLLECTION: frozenset({"author", "title", "booktitle", "publisher", "year"}),
+    BibTeXEntryType.INREFERENCE: frozenset({"author", "title", "booktitle", "year"}),
+    BibTeXEntryType.REPORT: frozenset({"author", "title", "institution", "year"}),
+    BibTeXEntryType.SOFTWARE: frozenset({"title"}),
+    BibTeXEntryType.STANDARD: frozenset({"title", "organization"}),
+    BibTeXEntryType.THESIS: frozenset({"author", "title", "school", "year"}),
 }
 
 
-@dataclass
+def _no_required_fields(fields: Dict[str, str]) -> None:
+    """Check for entry types without required fields."""
+
+
+def _required_fields_check(entry_type: BibTeXEntryType, required: FrozenSet[str]) -> Callable[[Dict[str, str]], None]:
+    """Build the required-fields check for one entry type.
+
+    Args:
+        entry_type: The entry type, named in the error message.
+        required: The fields entries of this type must have.
+
+    Returns:
+        A function raising InvalidInputError for fields missing a required one.
+    """
+    if not required:
+        return _no_required_fields
+
+    def check(fields: Dict[str, str]) -> None:
+        missing = required.difference(fields)
+        if missing:
+            raise InvalidInputError(
+                f"Missing required fields for {entry_type.value}: {', '.join(missing)}"
+            )
+    return check
+
+
+# Required-fields check per entry type, built once at import time
+_REQUIRED_FIELDS_CHECKS: Dict[BibTeXEntryType, Callable[[Dict[str, str]], None]] = {
+    entry_type: _required_fields_check(entry_type, required)
+    for entry_type, required in REQUIRED_FIELDS.items()
+}
+
+
+@dataclass(slots=True)
 class BibTeXEntry:
-    """A BibTeX entry with validation and field support."""
+    """A BibTeX entry with validation and field support.
+
+    Uses slots, as large bibliographies create many entries.
+    """
 
     entry_type: BibTeXEntryType
     key: str
     fields: Dict[str, str] = field(default_factory=dict)
+    # Pass False to skip validation when the entry is created, e.g. for
+    # trusted input or when only some entries are used; validate() can
+    # still be called later
+    validate_on_init: InitVar[bool] = True
+    # Processed names per field, with the raw value they were processed from
+    _names_cache: Optional[Dict[str, Tuple[Any, List[str]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def __post_init__(self) -> None:
-        """Validate the entry after initialization."""
-        self.validate()
+    def __post_init__(self, validate_on_init: bool) -> None:
+        """Validate the entry after initialization, unless disabled."""
+        if validate_on_init:
+            self.validate()
 
     def validate(self) -> None:
         """Validate the entry's required fields and field formats.
@@ -83,18 +204,12 @@ class BibTeXEntry:
             InvalidInputError: If required fields are missing or if fields have invalid formats.
         """
         # Validate field formats
-        if "year" in self.fields:
-            year = self.fields["year"]
-            if not year.isdigit() or len(year) != 4:
-                raise InvalidInputError(f"Invalid year format: {year}")
+        year = self.fields.get("year")
+        if year is not None and not _YEAR_RE.fullmatch(year):
+            raise InvalidInputError(f"Invalid year format: {year}")
 
         # Check for missing required fields
-        required = REQUIRED_FIELDS.get(self.entry_type, set())
-        missing = required - set(self.fields.keys())
-        if missing:
-            raise InvalidInputError(
-                f"Missing required fields for {self.entry_type.value}: {', '.join(missing)}"
-            )
+        _REQUIRED_FIELDS_CHECKS.get(self.entry_type, _no_required_fields)(self.fields)
 
     def get_field(self, field_name: str, default: Optional[str] = None) -> Optional[str]:
         """Get a field value with optional default.
@@ -107,15 +222,10 @@ class BibTeXEntry:
             The field value or the default if not present.
         """
         value = self.fields.get(field_name, default)
-        if value is not None:
-            if isinstance(value, list):
-                # For lists (like authors), return the list as is
-                return value
-            # Remove single curly braces but preserve double braces
-            value = value.replace("{{", "").replace("}}", "")
-            value = value.replace("{", "").replace("}", "")
-            # Normalize multiline fields by replacing newlines with spaces
-            value = value.replace("\n", " ")
+        if isinstance(value, str):
+            # Remove curly braces and replace newlines with spaces in one pass
+            return value.translate(_FIELD_CLEANUP)
+        # Lists (like authors) and non-string defaults are returned as is
         return value
 
     def has_field(self, field_name: str) -> bool:
@@ -143,56 +253,44 @@ class BibTeXEntry:
             
         # Handle both list and string inputs
         if isinstance(field_value, list):
-            names = field_value
+            # The parser's editor customization yields {'name': ..., 'ID': ...}
+            names = [name.get('name', '') if isinstance(name, dict) else name for name in field_value]
         else:
-            # Split on ' and ' but not within braces
-            names = []
-            current = ""
-            brace_level = 0
-            for char in field_value:
-                if char == '{':
-                    brace_level += 1
-                elif char == '}':
-                    brace_level -= 1
-                elif char == 'a' and brace_level == 0 and current.endswith(' '):
-                    # Check for ' and ' pattern
-                    if current.endswith(' and '):
-                        names.append(current[:-5].strip())
-                        current = ""
-                        continue
-                current += char
-            if current:
-                names.append(current.strip())
-        
-        # Process each name
-        processed_names = []
-        for name in names:
-            # Remove outer braces and convert LaTeX to Unicode
-            name = name.strip('{}')
-            name = latex_to_unicode(name)
-            
-            # Convert "Last, First" to "First Last"
-            if ', ' in name:
-                parts = name.split(', ', 1)
-                name = parts[1] + ' ' + parts[0]
-            
-            # Clean up whitespace
-            name = ' '.join(name.split())
-            if name:
-                processed_names.append(name)
-                
-        return processed_names
+            names = _split_names(field_value)
+        return [name for name in map(_normalize_name, names) if name]
+
+    def _get_names(self, field_name: str) -> List[str]:
+        """Get the processed names of an author/editor field.
+
+        The result is cached per entry and reused as long as the field still
+        holds an equal value, so both replacing the field value and editing a
+        list of names in place are picked up.
+
+        Args:
+            field_name: 'author' or 'editor'.
+
+        Returns:
+            A new list of names in "First Last" format.
+        """
+        value = self.fields.get(field_name)
+        if value is None:
+            return []
+        cache = self._names_cache
+        if cache is None:
+            cache = self._names_cache = {}
+        # Strings are immutable; lists are compared by a snapshot of their names
+        key = value if isinstance(value, str) else tuple(
+            name.get('name', '') if isinstance(name, dict) else name for name in value
+        )
+        cached = cache.get(field_name)
+        if cached is None or cached[0] != key:
+            cached = cache[field_name] = (key, self._process_names(value))
+        return list(cached[1])
 
     def get_authors(self) -> List[str]:
         """Get list of authors from the author field."""
-        author_field = self.fields.get('author')
-        if author_field is None:
-            return []
-        return self._process_names(author_field)
+        return self._get_names('author')
 
     def get_editors(self) -> List[str]:
         """Get list of editors from the editor field."""
-        editor_field = self.fields.get('editor')
-        if editor_field is None:
-            return []
-        return self._process_names(editor_field) 
\ No newline at end of file
+        return self._get_names('editor')
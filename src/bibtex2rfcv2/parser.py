@@ -1,11 +1,17 @@
 """BibTeX parser module."""
 
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Union, TextIO, Any
+from typing import Dict, Iterator, List, Union, TextIO, Any
 import logging
 
 import bibtexparser
+from bibtexparser.bibdatabase import BibDataString, BibDataStringExpression, UndefinedString
 from bibtexparser.customization import convert_to_unicode, editor, author
 from bibtex2rfcv2.models import BibTeXEntry, BibTeXEntryType
 from bibtex2rfcv2.error_handling import InvalidInputError, FileNotFoundError
@@ -13,6 +19,25 @@ from bibtex2rfcv2.error_handling import InvalidInputError, FileNotFoundError
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Lowercase entry type names mapped to their enum members, including the
+# only special case: inproceeding -> inproceedings
+_ENTRY_TYPES = {entry_type.value: entry_type for entry_type in BibTeXEntryType}
+_ENTRY_TYPES["inproceeding"] = BibTeXEntryType.INPROCEEDINGS
+
+# Number of records from which customization may run in a process pool
+_PARALLEL_THRESHOLD = 500
+
+# Separators between URLs in a url field
+_URL_SPLIT_RE = re.compile(r'[,\n]+')
+
+def _expand_expression(expression: BibDataStringExpression) -> str:
+    """Expand a string expression, keeping undefined macros as their names."""
+    try:
+        return expression.get_value()
+    except UndefinedString:
+        return ''.join(part.name if isinstance(part, BibDataString) else part
+                       for part in expression.expr)
+
 def _process_month_field(month_val: Any) -> str:
     """Process a month field value from BibTeX entry.
     
@@ -29,39 +54,58 @@ def _process_month_field(month_val: Any) -> str:
         - Iterable objects
         - String values
     """
-    print(f"DEBUG: month_val type: {type(month_val)}, value: {month_val}")  # Debug print
+    logger.debug("month_val type: %s, value: %s", type(month_val), month_val)
+    # Plain strings are the common case; skip the attribute probing below
+    if isinstance(month_val, str):
+        return month_val
+    if isinstance(month_val, BibDataStringExpression):
+        return _expand_expression(month_val)
     try:
         # If it has a .l attribute (BibDataStringExpression), extract the .value of the first item
         if hasattr(month_val, 'l') and month_val.l and hasattr(month_val.l[0], 'value'):
             return month_val.l[0].value
         elif hasattr(month_val, 'value'):
             return month_val.value
-        elif hasattr(month_val, '__iter__') and not isinstance(month_val, str):
+        elif hasattr(month_val, '__iter__'):
             return ''.join(str(x) for x in month_val)
         else:
             return str(month_val)
     except Exception:
         return str(month_val)
 
-def customizations(record):
-    """Customize parsed entries.
-    
+def _expand_values(record):
+    """Convert BibDataStringExpression and other non-string values to strings in place.
+
     Args:
         record: A record dictionary
-        
-    Returns:
-        The customized record
     """
-    # Convert BibDataStringExpression objects to strings
     for key, val in record.items():
-        if hasattr(val, 'l') and val.l and hasattr(val.l[0], 'value'):
+        # Almost every value is already a string
+        if isinstance(val, str):
+            continue
+        if isinstance(val, BibDataStringExpression):
+            # Expand macros such as the common month strings (nov -> November)
+            record[key] = _expand_expression(val)
+        elif hasattr(val, 'l') and val.l and hasattr(val.l[0], 'value'):
             record[key] = val.l[0].value
         elif hasattr(val, 'value'):
             record[key] = val.value
-        elif hasattr(val, '__iter__') and not isinstance(val, str):
+        elif hasattr(val, '__iter__'):
             record[key] = ''.join(str(x) for x in val)
         else:
             record[key] = str(val)
+
+def customizations(record):
+    """Customize parsed entries.
+    
+    Args:
+        record: A record dictionary
+        
+    Returns:
+        The customized record
+    """
+    # Convert BibDataStringExpression objects to strings
+    _expand_values(record)
     
     # Convert LaTeX to Unicode
     record = convert_to_unicode(record)
@@ -72,10 +116,44 @@ def customizations(record):
     
     # Normalize newlines and spaces in URL field
     if 'url' in record:
-        record['url'] = ', '.join(url.strip() for url in record['url'].replace('\n', ',').split(','))
+        record['url'] = ', '.join(url for url in (part.strip() for part in _URL_SPLIT_RE.split(record['url'])) if url)
     
     return record
 
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on, honouring affinity masks."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _customize_records(records: List[Dict[str, Any]], jobs: int = 1) -> List[Dict[str, Any]]:
+    """Apply customizations to every parsed record.
+
+    With jobs > 1, inputs of at least _PARALLEL_THRESHOLD records are spread
+    over a process pool of up to jobs workers, capped at the CPUs available
+    to this process. Everything else is customized in this process, as is
+    any input parsed inside a daemonic process, which may not start one.
+
+    Args:
+        records: The records returned by bibtexparser
+        jobs: Maximum number of worker processes; 1 customizes serially
+
+    Returns:
+        The customized records, in input order
+    """
+    workers = 1
+    if (jobs > 1 and len(records) >= _PARALLEL_THRESHOLD
+            and not multiprocessing.current_process().daemon):
+        workers = min(jobs, _available_cpus())
+    if workers < 2:
+        return [customizations(record) for record in records]
+    # String expressions refer back to the whole database, so expand them
+    # here rather than pickling the database along with every record
+    for record in records:
+        _expand_values(record)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(customizations, records, chunksize=64))
+
 def extract_content(source: Union[str, Path, TextIO]) -> str:
     """Extract BibTeX content from a file, string, or file-like object.
 
@@ -93,29 +171,35 @@ def extract_content(source: Union[str, Path, TextIO]) -> str:
     if isinstance(source, (str, Path)):
         if isinstance(source, Path):
             try:
-                print(f"Reading file: {source}")  # Debugging statement
-                content = source.read_text()
-                print(f"Content read: {content}")  # Debugging statement
+                logger.debug("Reading file: %s", source)
+                content = source.read_bytes().decode('utf-8')
+                # Keep read_text()'s universal newline handling
+                if '\r' in content:
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
             except UnicodeDecodeError as e:
                 raise InvalidInputError(f"Could not decode file: {source}") from e
             except Exception as e:
                 raise FileNotFoundError(f"Could not read file: {source}") from e
         else:
             content = source
-            print(f"Parsing content from string: {content}")  # Debugging statement
     elif hasattr(source, 'read'):
         # Handle file-like objects (like stdin)
-        content = source.read()
+        try:
+            content = source.read()
+        except UnicodeDecodeError as e:
+            raise InvalidInputError(f"Could not decode file: {getattr(source, 'name', source)}") from e
     else:
         raise InvalidInputError("source must be a string, Path, or file-like object")
     return content
 
-def parse_bibtex(source: Union[str, Path, TextIO]) -> List[BibTeXEntry]:
+def parse_bibtex(source: Union[str, Path, TextIO], jobs: int = 1) -> List[BibTeXEntry]:
     """Parse BibTeX content from a file, string, or file-like object.
 
     Args:
         source: Either a path to a BibTeX file, a string containing BibTeX content,
                or a file-like object (like stdin).
+        jobs: Maximum number of worker processes used to customize large
+              inputs; the default of 1 never starts any.
 
     Returns:
         A list of BibTeXEntry objects.
@@ -124,32 +208,52 @@ def parse_bibtex(source: Union[str, Path, TextIO]) -> List[BibTeXEntry]:
         InvalidInputError: If the input is invalid BibTeX or wrong type.
         FileNotFoundError: If the file cannot be read.
     """
-    logger.debug(f"Parsing BibTeX content from: {source}")
+    return list(iter_bibtex(source, jobs))
+
+def iter_bibtex(source: Union[str, Path, TextIO], jobs: int = 1) -> Iterator[BibTeXEntry]:
+    """Parse BibTeX content and yield the entries one at a time.
+
+    The input is parsed when the first entry is requested; each BibTeXEntry
+    is then built only as it is consumed, and the parsed records are
+    released as they are turned into entries.
+
+    Args:
+        source: Either a path to a BibTeX file, a string containing BibTeX content,
+               or a file-like object (like stdin).
+        jobs: Maximum number of worker processes used to customize large
+              inputs; the default of 1 never starts any.
+
+    Yields:
+        BibTeXEntry objects in input order.
+
+    Raises:
+        InvalidInputError: If the input is invalid BibTeX or wrong type.
+        FileNotFoundError: If the file cannot be read.
+    """
+    logger.debug("Parsing BibTeX content from: %s", source)
     # Configure parser to be lenient with unknown fields
     parser = bibtexparser.bparser.BibTexParser(
         common_strings=True,
         ignore_nonstandard_types=False,
         homogenize_fields=False,
         interpolate_strings=False,
-        customization=customizations  # Use our customizations function during parsing
+        customization=None  # Applied after parsing, see _customize_records
     )
     
     content = extract_content(source)
 
     try:
         entries = bibtexparser.loads(content, parser=parser)
-        # No need to apply customizations here since we're using it in the parser
-        logger.debug(f"Raw parsed entries: {entries.entries}")
-        # Print the parsed entries for debugging
-        print(f"Parsed entries: {entries.entries}")
-        
-        # Debug log the author/editor fields
-        for entry in entries.entries:
-            if 'author' in entry:
-                logger.debug(f"Author field for {entry.get('ID', 'unknown')}: {entry['author']}")
-            if 'editor' in entry:
-                logger.debug(f"Editor field for {entry.get('ID', 'unknown')}: {entry['editor']}")
-                
+        entries.entries = _customize_records(entries.entries, jobs)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw parsed entries: %s", entries.entries)
+            # Debug log the author/editor fields
+            for entry in entries.entries:
+                if 'author' in entry:
+                    logger.debug("Author field for %s: %s", entry.get('ID', 'unknown'), entry['author'])
+                if 'editor' in entry:
+                    logger.debug("Editor field for %s: %s", entry.get('ID', 'unknown'), entry['editor'])
+
     except Exception as e:
         logger.error(f"Error parsing BibTeX: {e}")
         raise InvalidInputError(f"Failed to parse BibTeX: {e}") from e
@@ -158,31 +262,38 @@ def parse_bibtex(source: Union[str, Path, TextIO]) -> List[BibTeXEntry]:
     if not entries.entries:
         if content and content.strip():
             raise InvalidInputError("No valid BibTeX entries found in input")
-        return []
-
-    result = []
-    for entry in entries.entries:
-        # Convert entry type to lowercase for case-insensitive matching
-        entry_type = entry["ENTRYTYPE"].lower()
-        # Handle the only special case: inproceeding -> inproceedings
-        if entry_type == "inproceeding":
-            entry_type = "inproceedings"
+        return
+
+    # Pop the records off the end so that each one is released as soon as
+    # its entry has been built
+    records = entries.entries
+    del content, entries
+    records.reverse()
+    while records:
+        entry = records.pop()
+        # Match the entry type case-insensitively in a single lookup
+        type_name = entry["ENTRYTYPE"].lower()
+        entry_type = _ENTRY_TYPES.get(type_name)
+        if entry_type is None:
+            logger.warning("Warning: Skipping entry with unsupported type '%s'", type_name)
+            continue
         
+        # The record is no longer referenced by the database, so it becomes
+        # the fields dict once the two bookkeeping keys are removed
+        key = entry.pop("ID")
+        del entry["ENTRYTYPE"]
+        fields = entry
+        # Intern the field names, which every entry otherwise holds its own
+        # copies of; moving each field to the end in turn keeps their order
+        for name in list(fields):
+            fields[sys.intern(name)] = fields.pop(name)
         # Convert BibDataStringExpression or similar objects to string for 'month'
-        fields = {k: v for k, v in entry.items() if k not in ("ENTRYTYPE", "ID")}
         if "month" in fields:
             fields["month"] = _process_month_field(fields["month"])
             
-        try:
-            result.append(
-                BibTeXEntry(
-                    entry_type=BibTeXEntryType(entry_type),
-                    key=entry["ID"],
-                    fields=fields,
-                )
-            )
-        except ValueError as e:
-            logger.warning(f"Warning: Skipping entry with unsupported type '{entry_type}': {e}")
-            continue
-            
-    return result 
\ No newline at end of file
+        bibtex_entry = BibTeXEntry(
+            entry_type=entry_type,
+            key=key,
+            fields=fields,
+        )
+        yield bibtex_entry 
\ No newline at end of file
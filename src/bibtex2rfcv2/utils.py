@@ -1,76 +1,116 @@
 """Utility functions for BibTeX to RFC conversion."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Mapping for LaTeX accents to Unicode
+_ACCENT_MAP = {
+    "'": {
+        'a': 'á', 'e': 'é', 'i': 'í', 'o': 'ó', 'u': 'ú', 'y': 'ý',
+        'A': 'Á', 'E': 'É', 'I': 'Í', 'O': 'Ó', 'U': 'Ú', 'Y': 'Ý',
+    },
+    '`': {
+        'a': 'à', 'e': 'è', 'i': 'ì', 'o': 'ò', 'u': 'ù',
+        'A': 'À', 'E': 'È', 'I': 'Ì', 'O': 'Ò', 'U': 'Ù',
+    },
+    '"': {
+        'a': 'ä', 'e': 'ë', 'i': 'ï', 'o': 'ö', 'u': 'ü', 'y': 'ÿ',
+        'A': 'Ä', 'E': 'Ë', 'I': 'Ï', 'O': 'Ö', 'U': 'Ü', 'Y': 'Ÿ',
+    },
+    '^': {
+        'a': 'â', 'e': 'ê', 'i': 'î', 'o': 'ô', 'u': 'û',
+        'A': 'Â', 'E': 'Ê', 'I': 'Î', 'O': 'Ô', 'U': 'Û',
+    },
+    '~': {
+        'a': 'ã', 'n': 'ñ', 'o': 'õ',
+        'A': 'Ã', 'N': 'Ñ', 'O': 'Õ',
+    },
+    'c': {
+        'c': 'ç', 'C': 'Ç',
+    },
+    'v': {
+        's': 'š', 'S': 'Š', 'z': 'ž', 'Z': 'Ž', 'c': 'č', 'C': 'Č',
+    },
+    'u': {
+        'g': 'ğ', 'G': 'Ğ',
+    },
+    '.': {
+        'I': 'İ',
+    },
+}
+# The same map keyed by accent and letter together, e.g. "'e" -> 'é'
+_FLAT_ACCENTS = {
+    accent + char: value
+    for accent, chars in _ACCENT_MAP.items()
+    for char, value in chars.items()
+}
+
+# All accent forms in one pattern, so text is scanned once. The braced
+# forms come first: {\c{c}}, {\v{s}}, {\u{g}}, {\.I}, {\'e}, then \'e
+_ACCENT_RE = re.compile(
+    r'\{\\c\{([a-zA-Z])\}\}'
+    r'|\{\\v\{([a-zA-Z])\}\}'
+    r'|\{\\u\{([a-zA-Z])\}\}'
+    r'|\{\\\.([a-zA-Z])\}'
+    r'|\{\\(["' + "'`^~" + r'])([a-zA-Z])}'
+    r'|\\(["\'`^~cvu.])([a-zA-Z])'
+)
+# Accent of each single-letter braced form, by the index of its group
+_BRACED_ACCENTS = {1: 'c', 2: 'v', 3: 'u', 4: '.'}
+_BRACE_TABLE = str.maketrans('', '', '{}')
+
+
+def _replace_accent(match: re.Match) -> str:
+    """Replace one match of _ACCENT_RE with its Unicode character."""
+    index = match.lastindex
+    if index in _BRACED_ACCENTS:
+        key = _BRACED_ACCENTS[index] + match.group(index)
+    else:
+        key = match.group(index - 1) + match.group(index)
+    return _FLAT_ACCENTS.get(key, match.group(0))
+
+
 def latex_to_unicode(text: str) -> str:
     """Convert LaTeX accents and special characters to Unicode.
+
+    Text with LaTeX commands or braces is converted once and memoized, since
+    journal names, publishers and author names repeat across entries;
+    ``latex_to_unicode.cache_info()`` reports hits. Plain text, which is most
+    values, is returned before the cache so that one-off titles and URLs do
+    not evict the names worth keeping. The cache relies on the conversion
+    depending only on its input, so keep it free of side effects.
     
     Args:
         text: A string containing LaTeX accents and special characters.
     Returns:
         A string with LaTeX accents and special characters converted to Unicode.
     """
-    if not text:
+    if not text or ('\\' not in text and '{' not in text and '}' not in text):
         return text
+    return _convert_latex(text)
 
-    # Mapping for LaTeX accents to Unicode
-    accent_map = {
-        "'": {
-            'a': 'á', 'e': 'é', 'i': 'í', 'o': 'ó', 'u': 'ú', 'y': 'ý',
-            'A': 'Á', 'E': 'É', 'I': 'Í', 'O': 'Ó', 'U': 'Ú', 'Y': 'Ý',
-        },
-        '`': {
-            'a': 'à', 'e': 'è', 'i': 'ì', 'o': 'ò', 'u': 'ù',
-            'A': 'À', 'E': 'È', 'I': 'Ì', 'O': 'Ò', 'U': 'Ù',
-        },
-        '"': {
-            'a': 'ä', 'e': 'ë', 'i': 'ï', 'o': 'ö', 'u': 'ü', 'y': 'ÿ',
-            'A': 'Ä', 'E': 'Ë', 'I': 'Ï', 'O': 'Ö', 'U': 'Ü', 'Y': 'Ÿ',
-        },
-        '^': {
-            'a': 'â', 'e': 'ê', 'i': 'î', 'o': 'ô', 'u': 'û',
-            'A': 'Â', 'E': 'Ê', 'I': 'Î', 'O': 'Ô', 'U': 'Û',
-        },
-        '~': {
-            'a': 'ã', 'n': 'ñ', 'o': 'õ',
-            'A': 'Ã', 'N': 'Ñ', 'O': 'Õ',
-        },
-        'c': {
-            'c': 'ç', 'C': 'Ç',
-        },
-        'v': {
-            's': 'š', 'S': 'Š', 'z': 'ž', 'Z': 'Ž', 'c': 'č', 'C': 'Č',
-        },
-        'u': {
-            'g': 'ğ', 'G': 'Ğ',
-        },
-        '.': {
-            'I': 'İ',
-        },
-    }
-
-    def replace_accented(match):
-        accent = match.group(1)
-        char = match.group(2)
-        return accent_map.get(accent, {}).get(char, match.group(0))
-
-    # Curly-brace forms for all supported accents
-    text = re.sub(r'\{\\c\{([a-zA-Z])\}\}', lambda m: accent_map['c'].get(m.group(1), m.group(0)), text)
-    text = re.sub(r'\{\\v\{([a-zA-Z])\}\}', lambda m: accent_map['v'].get(m.group(1), m.group(0)), text)
-    text = re.sub(r'\{\\u\{([a-zA-Z])\}\}', lambda m: accent_map['u'].get(m.group(1), m.group(0)), text)
-    text = re.sub(r'\{\\\.([a-zA-Z])\}', lambda m: accent_map['.'].get(m.group(1), m.group(0)), text)
-    text = re.sub(r'\{\\(["' + "'`^~" + '])([a-zA-Z])}', lambda m: accent_map[m.group(1)].get(m.group(2), m.group(0)), text)
-
-    # Direct form: \'e
-    text = re.sub(r'\\(["\'`^~cvu.])([a-zA-Z])', replace_accented, text)
+
+@lru_cache(maxsize=8192)
+def _convert_latex(text: str) -> str:
+    """Convert text known to contain LaTeX commands or braces."""
+    text = _ACCENT_RE.sub(_replace_accent, text)
 
     # Remove any remaining curly braces
-    text = text.replace("{", "").replace("}", "")
-    return text 
+    return text.translate(_BRACE_TABLE)
+
+
+# Keep the lru_cache introspection on the public function
+latex_to_unicode.cache_info = _convert_latex.cache_info
+latex_to_unicode.cache_clear = _convert_latex.cache_clear
+
 
 def extract_ascii(text: str) -> Optional[str]:
     """Extract ASCII version of text by removing accents and special characters.
+
+    Like latex_to_unicode, results are memoized for repeated values; text
+    that is already ASCII, such as most abstracts and notes, is answered
+    before the cache and never stored in it.
     
     Args:
         text: The text to convert to ASCII.
@@ -80,8 +120,23 @@ def extract_ascii(text: str) -> Optional[str]:
     """
     if not text:
         return None
+    # ASCII without any LaTeX command stays ASCII after conversion
+    if text.isascii() and '\\' not in text:
+        return None
+    return _extract_ascii(text)
+
+
+@lru_cache(maxsize=4096)
+def _extract_ascii(text: str) -> Optional[str]:
+    """Extract the ASCII version of text that may convert to non-ASCII."""
     # Convert to Unicode first to handle LaTeX accents
     unicode_text = latex_to_unicode(text)
+    if unicode_text.isascii():
+        return None
     # Then convert to ASCII by removing non-ASCII characters
-    ascii_text = ''.join(c for c in unicode_text if ord(c) < 128)
-    return ascii_text if ascii_text != unicode_text else None 
\ No newline at end of file
+    return unicode_text.encode('ascii', 'ignore').decode('ascii')
+
+
+# Keep the lru_cache introspection on the public function
+extract_ascii.cache_info = _extract_ascii.cache_info
+extract_ascii.cache_clear = _extract_ascii.cache_clear
@@ -1,12 +1,14 @@
 """Converter from BibTeXEntry to RFC XML v3 reference."""
 
 import logging
+from functools import lru_cache
+from io import StringIO
 from typing import Optional
 import re
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, TextIO, Union
+from typing import Dict, Iterable, List, TextIO, Union
 
 from bibtex2rfcv2.models import BibTeXEntry, BibTeXEntryType
 from bibtex2rfcv2.xml_models import (
@@ -17,12 +19,67 @@ from bibtex2rfcv2.xml_models import (
     Reference,
 )
 from bibtex2rfcv2.utils import latex_to_unicode, extract_ascii
-from bibtex2rfcv2.error_handling import InvalidInputError, FileNotFoundError, ConversionError, logger
+from bibtex2rfcv2.error_handling import InvalidInputError, FileNotFoundError, ConversionError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# BibTeX month names and abbreviations mapped to RFC XML month numbers
+_MONTH_NUMBERS = {
+    "jan": "1", "january": "1",
+    "feb": "2", "february": "2",
+    "mar": "3", "march": "3",
+    "apr": "4", "april": "4",
+    "may": "5",
+    "jun": "6", "june": "6",
+    "jul": "7", "july": "7",
+    "aug": "8", "august": "8",
+    "sep": "9", "september": "9",
+    "oct": "10", "october": "10",
+    "nov": "11", "november": "11",
+    "dec": "12", "december": "12",
+}
+
+# Month lookup including the usual "Jan" and "JAN" spellings, so that most
+# values resolve without lowercasing them first
+_MONTH_MAP = {
+    variant: number
+    for name, number in _MONTH_NUMBERS.items()
+    for variant in (name, name.capitalize(), name.upper())
+}
+
+# Fields converted explicitly rather than by the generic seriesInfo loop
+_HANDLED_FIELDS = frozenset({
+    "year", "month", "journal", "booktitle", "author", "title", "abstract", "note",
+})
+
+# BibTeX field names mapped to RFC XML seriesInfo names
+_FIELD_MAPPING = {
+    'isbn': 'ISBN',
+    'doi': 'DOI',
+    'date-modified': 'DateModified',
+    'number': 'Report Number',
+    'url': 'URL',
+    'howpublished': 'HowPublished',
+    'publisher': 'Publisher',
+}
+
+
+@lru_cache(maxsize=256)
+def _series_info_name(field: str) -> str:
+    """Get the seriesInfo name for a BibTeX field.
+
+    Field names repeat across all entries of a bibliography, so the names
+    are memoized.
+
+    Args:
+        field: The BibTeX field name.
+
+    Returns:
+        The mapped name for known fields such as URL and DOI, else the
+        capitalized field name.
+    """
+    return _FIELD_MAPPING.get(field.lower()) or field.capitalize()
+
 
 def normalize_month(month: str) -> str:
     """Normalize month string to RFC XML v3 format.
@@ -33,23 +90,34 @@ def normalize_month(month: str) -> str:
     Returns:
         Normalized month string (1-12)
     """
-    month_map = {
-        "jan": "1", "january": "1",
-        "feb": "2", "february": "2",
-        "mar": "3", "march": "3",
-        "apr": "4", "april": "4",
-        "may": "5",
-        "jun": "6", "june": "6",
-        "jul": "7", "july": "7",
-        "aug": "8", "august": "8",
-        "sep": "9", "september": "9",
-        "oct": "10", "october": "10",
-        "nov": "11", "november": "11",
-        "dec": "12", "december": "12",
-    }
-    # Handle BibDataStringExpression by converting to string first
+    if isinstance(month, str):
+        # Numeric months ("5", "05") are passed through as they are
+        if month[:1].isdigit():
+            return month
+        month_num = _MONTH_MAP.get(month)
+        if month_num is not None:
+            return month_num
+    elif isinstance(month, int):
+        return str(month)
+    # Other spellings, and values that are not strings yet
     month_str = str(month).lower()
-    return month_map.get(month_str, month_str)
+    return _MONTH_MAP.get(month_str, month_str)
+
+
+def validate_entry(entry: BibTeXEntry) -> None:
+    """Check that a BibTeXEntry has the fields an RFC XML reference needs.
+
+    Args:
+        entry: The BibTeXEntry to check.
+
+    Raises:
+        InvalidInputError: If the title, or both author and editor, are missing.
+    """
+    get = entry.fields.get
+    # Title first: it is the field degenerate entries most often lack
+    if not get("title") or not (get("author") or get("editor")):
+        logger.error("Missing required fields: author or editor, and title")
+        raise InvalidInputError("Missing required fields: author or editor, and title")
 
 
 def bibtex_entry_to_rfcxml(entry: BibTeXEntry) -> str:
@@ -64,164 +132,116 @@ def bibtex_entry_to_rfcxml(entry: BibTeXEntry) -> str:
     Raises:
         InvalidInputError: If the entry cannot be converted.
     """
-    if not entry.fields.get("author") and not entry.fields.get("editor") or not entry.fields.get("title"):
-        logger.error("Missing required fields: author or editor, and title")
-        raise InvalidInputError("Missing required fields: author or editor, and title")
+    out = StringIO()
+    bibtex_entry_to_rfcxml_stream(entry, out)
+    return out.getvalue()
+
+
+def bibtex_entry_to_rfcxml_stream(entry: BibTeXEntry, out: TextIO) -> None:
+    """Convert a BibTeXEntry to an RFC XML v3 reference written to a stream.
+
+    The reference is written piece by piece instead of being assembled into
+    a single string first, so large bibliographies can be written straight
+    to an output file.
+
+    Args:
+        entry: The BibTeXEntry to convert.
+        out: The text stream to write the XML representation to.
+
+    Raises:
+        InvalidInputError: If the entry cannot be converted.
+    """
+    validate_entry(entry)
+    fields = entry.fields
+    get = fields.get
     try:
         # --- Begin conversion logic ---
-        logger.info(f"Generated XML for entry {entry.key} ({entry.entry_type}):")
-        
-        # Get authors
-        authors = []
-        author_field = entry.get_field('author')
-        if author_field:
-            # Split on ' and ' but not within braces
-            author_names = []
-            current = ""
-            brace_level = 0
-            for char in author_field:
-                if char == '{':
-                    brace_level += 1
-                elif char == '}':
-                    brace_level -= 1
-                elif char == 'a' and brace_level == 0 and current.endswith(' '):
-                    # Check for ' and ' pattern
-                    if current.endswith(' and '):
-                        author_names.append(current[:-5].strip())
-                        current = ""
-                        continue
-                current += char
-            if current:
-                author_names.append(current.strip())
-            
-            # Process each author name
-            for name in author_names:
-                # Remove outer braces and convert LaTeX to Unicode
-                name = name.strip('{}')
-                name = latex_to_unicode(name)
-                
-                # Convert "Last, First" to "First Last"
-                if ', ' in name:
-                    parts = name.split(', ', 1)
-                    name = parts[1] + ' ' + parts[0]
-                
-                # Clean up whitespace
-                name = ' '.join(name.split())
-                if name:
-                    authors.append(Author(name))
-        
-        # If no authors found, try editors
-        if not authors:
-            editor_field = entry.get_field('editor')
-            if editor_field:
-                # Split on ' and ' but not within braces
-                editor_names = []
-                current = ""
-                brace_level = 0
-                for char in editor_field:
-                    if char == '{':
-                        brace_level += 1
-                    elif char == '}':
-                        brace_level -= 1
-                    elif char == 'a' and brace_level == 0 and current.endswith(' '):
-                        # Check for ' and ' pattern
-                        if current.endswith(' and '):
-                            editor_names.append(current[:-5].strip())
-                            current = ""
-                            continue
-                    current += char
-                if current:
-                    editor_names.append(current.strip())
-                
-                # Process each editor name
-                for name in editor_names:
-                    # Remove outer braces and convert LaTeX to Unicode
-                    name = name.strip('{}')
-                    name = latex_to_unicode(name)
-                    
-                    # Convert "Last, First" to "First Last"
-                    if ', ' in name:
-                        parts = name.split(', ', 1)
-                        name = parts[1] + ' ' + parts[0]
-                    
-                    # Clean up whitespace
-                    name = ' '.join(name.split())
-                    if name:
-                        authors.append(Author(name))
-        
-        # If still no authors, use "Unknown"
-        if not authors:
-            authors = [Author("Unknown")]
+        # Authors, falling back to editors
+        authors = [Author(name) for name in entry.get_authors() or entry.get_editors() or ["Unknown"]]
 
         # Create series info list
         series_info = []
         
         # Add year if present
-        if "year" in entry.fields:
-            series_info.append(SeriesInfo(name="Year", value=entry.fields["year"]))
+        year = get("year")
+        if year is not None:
+            series_info.append(SeriesInfo(name="Year", value=year))
         
         # Add month if present
-        if "month" in entry.fields:
-            month_value = normalize_month(entry.fields["month"])
-            series_info.append(SeriesInfo(name="Month", value=month_value))
+        month = get("month")
+        if month is not None:
+            series_info.append(SeriesInfo(name="Month", value=normalize_month(month)))
         
         # Add journal if present
-        if "journal" in entry.fields:
-            series_info.append(SeriesInfo(name="Journal", value=entry.fields["journal"]))
+        journal = get("journal")
+        if journal is not None:
+            series_info.append(SeriesInfo(name="Journal", value=journal))
         
         # Add booktitle if present
-        if "booktitle" in entry.fields:
-            series_info.append(SeriesInfo(name="Booktitle", value=entry.fields["booktitle"]))
+        booktitle = get("booktitle")
+        if booktitle is not None:
+            series_info.append(SeriesInfo(name="Booktitle", value=booktitle))
         
-        # Add other fields as series info
-        for field, value in entry.fields.items():
-            if field not in ["year", "month", "journal", "booktitle", "author", "title", "abstract", "note"]:
-                # Map BibTeX field names to RFCXML field names
-                field_mapping = {
-                    'isbn': 'ISBN',
-                    'doi': 'DOI',
-                    'date-modified': 'DateModified',
-                    'number': 'Report Number',
-                    'url': 'URL',
-                    'howpublished': 'HowPublished',
-                    'publisher': 'Publisher',
-                }
-                # Ensure value is a string and not None
-                if value is not None:
-                    value_str = str(value)
-                    # Special handling for URLs and DOIs
-                    if field.lower() == 'url':
-                        series_info.append(SeriesInfo(name="URL", value=value_str))
-                    elif field.lower() == 'doi':
-                        series_info.append(SeriesInfo(name="DOI", value=value_str))
-                    else:
-                        field_name = field_mapping.get(field.lower(), field.capitalize())
-                        series_info.append(SeriesInfo(name=field_name, value=value_str))
+        # Add other fields as series info, extending the list in one step
+        series_info += [
+            SeriesInfo(name=_series_info_name(field), value=str(value))
+            for field, value in fields.items()
+            # Ensure value is a string and not None
+            if field not in _HANDLED_FIELDS and value is not None
+        ]
 
         # Create the reference
+        abstract = get("abstract")
+        note = get("note")
         ref = Reference(
             anchor=entry.key,
             front=Front(
-                title=entry.fields.get("title", ""),
+                title=get("title", ""),
                 authors=authors,
-                abstract=entry.fields.get("abstract"),
-                note=entry.fields.get("note"),
-                ascii_abstract=extract_ascii(entry.fields.get("abstract")) if entry.fields.get("abstract") else None,
-                ascii_note=extract_ascii(entry.fields.get("note")) if entry.fields.get("note") else None
+                abstract=abstract,
+                note=note,
+                ascii_abstract=extract_ascii(abstract) if abstract else None,
+                ascii_note=extract_ascii(note) if note else None
             ),
             series_info=series_info
         )
         
-        logger.info(f"<reference anchor=\"{ref.anchor}\">\n  <front>\n  <title>{ref.front.title}</title>")
-        for author in ref.front.authors:
-            logger.info(f"  <author fullname=\"{author.fullname}\"/>")
-        logger.info("</front>")
-        for info in ref.series_info:
-            logger.info(f"  <seriesInfo name=\"{info.name}\" value=\"{info.value}\"/>")
-        logger.info("</reference>")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated XML for entry %s (%s):", entry.key, entry.entry_type)
+            logger.debug("<reference anchor=\"%s\">\n  <front>\n  <title>%s</title>", ref.anchor, ref.front.title)
+            for author in ref.front.authors:
+                logger.debug("  <author fullname=\"%s\"/>", author.fullname)
+            logger.debug("</front>")
+            for info in ref.series_info:
+                logger.debug("  <seriesInfo name=\"%s\" value=\"%s\"/>", info.name, info.value)
+            logger.debug("</reference>")
         
-        return ref.to_xml()
+        ref.write_xml(out)
         # --- End conversion logic ---
     except Exception as e:
         logger.error(f"Conversion failed: {e}")
-        raise ConversionError(f"Conversion failed: {e}") from e 
\ No newline at end of file
+        raise ConversionError(f"Conversion failed: {e}") from e 
+
+
+def bibtex_entries_to_rfcxml(entries: Iterable[BibTeXEntry]) -> str:
+    """Convert many BibTeXEntry objects to RFC XML v3 references in one pass.
+
+    All references are written into a single buffer, each followed by a
+    newline, so a whole bibliography is converted with one setup cost.
+    ASCII variants of repeated values come from the extract_ascii cache.
+
+    Args:
+        entries: The BibTeXEntry objects to convert.
+
+    Returns:
+        A string containing the XML of all references, in input order.
+
+    Raises:
+        InvalidInputError: If an entry cannot be converted.
+    """
+    out = StringIO()
+    write = out.write
+    for entry in entries:
+        bibtex_entry_to_rfcxml_stream(entry, out)
+        write("\n")
+    return out.getvalue()
@@ -73,6 +73,29 @@ def test_to_xml_command_with_missing_fields():
         assert 'Error: Missing required fields: author or editor, and title' in result.output
 
 
+def test_to_xml_validate_only():
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.makedirs('tests/data', exist_ok=True)
+        minimal_bibtex = '@article{test, author="John Doe", title="Test Title", year="2023", journal="Test Journal"}'
+        with open('tests/data/minimal.bibtex', 'w') as f:
+            f.write(minimal_bibtex)
+        result = runner.invoke(main, ['to-xml', '--validate-only', 'tests/data/minimal.bibtex'])
+        assert result.exit_code == 0
+        assert 'Validation completed. 1 entries can be converted.' in result.output
+        assert not os.path.exists('output.xml')
+
+        src = str(Path(__file__).parent.parent / 'tests' / 'data' / 'icml2023.bibtex')
+        shutil.copyfile(src, 'tests/data/icml2023.bibtex')
+        result = runner.invoke(main, ['to-xml', '--validate-only', 'tests/data/icml2023.bibtex'])
+        assert result.exit_code != 0
+        assert 'Error: Missing required fields: author or editor, and title' in result.output
+
+        result = runner.invoke(main, ['to-xml', 'tests/data/minimal.bibtex'])
+        assert result.exit_code != 0
+        assert "Missing argument 'OUTPUT_FILE'" in result.output
+
+
 def test_to_xml_command_with_invalid_file():
     runner = CliRunner()
     with runner.isolated_filesystem():
@@ -81,6 +104,19 @@ def test_to_xml_command_with_invalid_file():
         assert 'Error: File not found: nonexistent.bibtex' in result.output
 
 
+@pytest.mark.parametrize("command,output", [("to-xml", "output.xml"), ("to-kdrfc", "output.yaml")])
+def test_input_errors_exit_with_status_1(command, output):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(main, [command, 'nonexistent.bibtex', output])
+        assert result.exit_code == 1
+        assert 'Error: File not found: nonexistent.bibtex' in result.output
+        os.makedirs('folder')
+        result = runner.invoke(main, [command, 'folder', output])
+        assert result.exit_code == 1
+        assert 'Error: Could not read file: folder' in result.output
+
+
 def test_file_reading():
     runner = CliRunner()
     with runner.isolated_filesystem():
@@ -120,8 +156,8 @@ def test_file_permissions():
         minimal_bibtex = '@article{test, author="John Doe", title="Test Title", year="2023", journal="Test Journal"}'
         with open('tests/data/minimal.bibtex', 'w') as f:
             f.write(minimal_bibtex)
-        # Mock os.access to simulate permission denied
-        with mock.patch('os.access', return_value=False):
+        # Make opening the input fail to simulate permission denied
+        with mock.patch('bibtex2rfcv2.cli.open', side_effect=PermissionError, create=True):
             result = runner.invoke(main, ['to-xml', 'tests/data/minimal.bibtex', 'output.xml'])
             assert result.exit_code != 0
             assert 'Error: Permission denied' in result.output
@@ -239,6 +275,106 @@ def test_batch_processing():
             os.remove(tmp_path)
 
 
+@pytest.mark.parametrize("command,output", [("to-xml", "output.xml"), ("to-kdrfc", "output.yaml")])
+def test_existing_output_survives_invalid_entry(command, output):
+    """Test that an invalid entry after the first one leaves the output file untouched."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        with open('input.bibtex', 'w') as f:
+            f.write('@article{good, author="Author", title="Title", year={2023}, journal="Journal"}\n'
+                    '@article{bad, author="Author", title="Title", year={20x0}, journal="Journal"}\n')
+        with open(output, 'w') as f:
+            f.write('previous output')
+        result = runner.invoke(main, [command, '--no-progress', 'input.bibtex', output])
+        assert result.exit_code == 1
+        assert 'Invalid year format' in result.output
+        with open(output) as f:
+            assert f.read() == 'previous output'
+        # The temporary file is removed again
+        assert sorted(os.listdir('.')) == sorted(['input.bibtex', output])
+
+
+def test_to_xml_parallel_jobs():
+    """Test that --jobs produces the same output as serial conversion."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.makedirs('tests/data', exist_ok=True)
+        entries = [
+            f'@article{{test{i}, author="Author {i}", title="Title {i}", year="2023", journal="Test Journal"}}'
+            for i in range(5)
+        ]
+        with open('tests/data/multiple.bibtex', 'w') as f:
+            f.write('\n'.join(entries))
+        result = runner.invoke(main, ['to-xml', '--no-progress', 'tests/data/multiple.bibtex', 'serial.xml'])
+        assert result.exit_code == 0
+        result = runner.invoke(main, ['to-xml', '--no-progress', '--jobs', '2', 'tests/data/multiple.bibtex', 'parallel.xml'])
+        assert result.exit_code == 0
+        assert 'Conversion completed. 5 entries written to parallel.xml.' in result.output
+        with open('serial.xml') as f:
+            serial_xml = f.read()
+        with open('parallel.xml') as f:
+            parallel_xml = f.read()
+        assert parallel_xml == serial_xml
+        assert parallel_xml.index('anchor="test0"') < parallel_xml.index('anchor="test4"')
+
+
+def test_to_kdrfc_parallel_jobs():
+    """Test that --jobs produces the same kdrfc output as serial conversion."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        os.makedirs('tests/data', exist_ok=True)
+        entries = [
+            f'@article{{test{i}, author="Author {i}", title="Title {i}", year="2023", journal="Test Journal"}}'
+            for i in range(5)
+        ]
+        with open('tests/data/multiple.bibtex', 'w') as f:
+            f.write('\n'.join(entries))
+        result = runner.invoke(main, ['to-kdrfc', '--no-progress', 'tests/data/multiple.bibtex', 'serial.yaml'])
+        assert result.exit_code == 0
+        result = runner.invoke(main, ['to-kdrfc', '--no-progress', '-j', '2', 'tests/data/multiple.bibtex', 'parallel.yaml'])
+        assert result.exit_code == 0
+        assert 'Conversion completed. 5 entries written to parallel.yaml.' in result.output
+        with open('serial.yaml') as f:
+            serial_yaml = f.read()
+        with open('parallel.yaml') as f:
+            parallel_yaml = f.read()
+        assert parallel_yaml == serial_yaml
+        assert parallel_yaml.index('test0:') < parallel_yaml.index('test4:')
+
+
+def test_parallel_conversion_reads_entries_lazily():
+    """Test that --jobs keeps only a bounded number of chunks in flight."""
+    from bibtex2rfcv2.cli import _kdrfc_chunk, _write_converted
+    entries = parse_bibtex('\n'.join(
+        f'@article{{test{i}, author="Author {i}", title="Title {i}", year="2023", journal="Test Journal"}}'
+        for i in range(10)
+    ))
+    consumed = []
+
+    def source():
+        for entry in entries:
+            consumed.append(entry)
+            yield entry
+
+    class Output:
+        def __init__(self):
+            self.data = []
+            self.consumed_at_first_write = None
+
+        def write(self, data):
+            if self.consumed_at_first_write is None:
+                self.consumed_at_first_write = len(consumed)
+            self.data.append(data)
+
+    out = Output()
+    with mock.patch('bibtex2rfcv2.cli.PARALLEL_CHUNK_SIZE', 1):
+        count = _write_converted(source(), out, _kdrfc_chunk, 2, False)
+    assert count == 10
+    # Four chunks are in flight before the fifth one is read
+    assert out.consumed_at_first_write == 5
+    assert b''.join(out.data) == b''.join(_kdrfc_chunk([entry]) for entry in entries)
+
+
 def test_to_xml_command_with_empty_file():
     runner = CliRunner()
     with runner.isolated_filesystem():
@@ -313,7 +449,7 @@ def test_to_xml_command_with_exception():
         os.makedirs('tests/data', exist_ok=True)
         with open('tests/data/exception.bibtex', 'w') as f:
             f.write('@article{test, author="John Doe", title="Test Title", year="2023", journal="Test Journal"}')
-        with mock.patch('bibtex2rfcv2.cli.bibtex_entry_to_rfcxml', side_effect=Exception('Test exception')) as mock_func:
+        with mock.patch('bibtex2rfcv2.cli.bibtex_entries_to_rfcxml', side_effect=Exception('Test exception')) as mock_func:
             result = runner.invoke(main, ['to-xml', 'tests/data/exception.bibtex', 'output.xml'])
             assert result.exit_code == 1
             assert 'Error: Test exception' in result.output
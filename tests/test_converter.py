@@ -434,6 +434,29 @@ def test_latex_to_unicode():
     # Test cases for mixed accents
     assert latex_to_unicode("Jos{\\'e} Su{\\'a}rez{-}Varela and Andr{\\'e} L{\\\"u}t{\\\"u}") == "José Suárez-Varela and André Lütü"
 
+def test_latex_to_unicode_cache():
+    from bibtex2rfcv2.utils import latex_to_unicode
+
+    latex_to_unicode.cache_clear()
+    assert latex_to_unicode("Proc. of {\\'E}cole") == "Proc. of École"
+    assert latex_to_unicode("Proc. of {\\'E}cole") == "Proc. of École"
+    info = latex_to_unicode.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+def test_latex_to_unicode_plain_text():
+    """Text without LaTeX commands or braces is returned as it is."""
+    from bibtex2rfcv2.utils import latex_to_unicode
+
+    plain = "Journal of Plain Text, Vol. 3"
+    latex_to_unicode.cache_clear()
+    assert latex_to_unicode(plain) is plain
+    # Plain text is not stored in the cache
+    assert latex_to_unicode.cache_info().currsize == 0
+    assert latex_to_unicode("Müller") == "Müller"
+    # A stray closing brace is still removed
+    assert latex_to_unicode("Proceedings}") == "Proceedings"
+
 def test_utf8_validation():
     import tempfile
     import xml.etree.ElementTree as ET
@@ -521,6 +544,35 @@ def test_utf8_validation():
             assert entry.fields["author"] in xml
             assert entry.fields["title"] in xml
 
+def test_missing_title_fails_before_conversion():
+    """An entry without a title is rejected before any XML is produced."""
+    import io
+    from bibtex2rfcv2.xml_converter import bibtex_entry_to_rfcxml_stream
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.MISC,
+        key="untitled",
+        fields={"author": "Doe, John", "year": "2023"},
+    )
+    out = io.StringIO()
+    with pytest.raises(InvalidInputError, match="Missing required fields"):
+        bibtex_entry_to_rfcxml_stream(entry, out)
+    assert out.getvalue() == ""
+
+def test_bibtex_entries_to_rfcxml_batch():
+    """Batch conversion equals the per-entry output joined with newlines."""
+    from bibtex2rfcv2.xml_converter import bibtex_entry_to_rfcxml, bibtex_entries_to_rfcxml
+    entries = [
+        BibTeXEntry(
+            entry_type=BibTeXEntryType.ARTICLE,
+            key=f"entry{i}",
+            fields={"author": "Doe, John", "title": f"Title {i}", "journal": "IEEE", "year": "2023"},
+        )
+        for i in range(3)
+    ]
+    xml = bibtex_entries_to_rfcxml(entries)
+    assert xml == "".join(bibtex_entry_to_rfcxml(entry) + "\n" for entry in entries)
+    assert bibtex_entries_to_rfcxml([]) == ""
+
 def test_error_handling():
     from bibtex2rfcv2.models import BibTeXEntry, BibTeXEntryType
     from bibtex2rfcv2.xml_converter import bibtex_entry_to_rfcxml
@@ -628,11 +680,59 @@ def test_special_fields():
     assert "<seriesInfo name=\"URL\" value=\"http://example.com\"" in xml
     assert "<seriesInfo name=\"DOI\" value=\"10.1234/example\"" in xml
 
+def test_rfcxml_stream_matches_string_output():
+    """Test that the streaming converter writes the same XML as the string converter."""
+    import io
+    from bibtex2rfcv2.xml_converter import bibtex_entry_to_rfcxml_stream
+    entry = BibTeXEntry(
+        key="stream",
+        entry_type=BibTeXEntryType.ARTICLE,
+        fields={
+            "author": "John Doe",
+            "title": "Streaming Title",
+            "year": "2023",
+            "journal": "Test Journal",
+            "doi": "10.1234/example"
+        }
+    )
+    out = io.StringIO()
+    bibtex_entry_to_rfcxml_stream(entry, out)
+    assert out.getvalue() == bibtex_entry_to_rfcxml(entry)
+    assert out.getvalue().startswith('<reference anchor="stream">')
+
+def test_normalize_month():
+    """Test month normalization to RFC XML month numbers."""
+    from bibtex2rfcv2.xml_converter import normalize_month
+    assert normalize_month("jan") == "1"
+    assert normalize_month("September") == "9"
+    assert normalize_month("DEC") == "12"
+    assert normalize_month("aPrIl") == "4"
+    assert normalize_month("5") == "5"
+    assert normalize_month("11") == "11"
+    assert normalize_month(11) == "11"
+    assert normalize_month("") == ""
+    assert normalize_month("spring") == "spring"
+
 def test_extract_ascii_empty():
     """Test extract_ascii with empty text."""
     assert extract_ascii("") is None
     assert extract_ascii(None) is None
 
+def test_extract_ascii():
+    """Test that extract_ascii drops non-ASCII characters."""
+    assert extract_ascii("Plain title") is None
+    assert extract_ascii("{Plain} title") is None
+    assert extract_ascii("Caf{\\'e}") == "Caf"
+    assert extract_ascii("Jos{\\'e} Müller") == "Jos Mller"
+    assert extract_ascii("日本") == ""
+    extract_ascii.cache_clear()
+    assert extract_ascii('M{\\"u}ller') == "Mller"
+    assert extract_ascii('M{\\"u}ller') == "Mller"
+    assert extract_ascii.cache_info().hits == 1
+    # ASCII text is answered without filling the cache
+    assert extract_ascii("An ASCII abstract") is None
+    assert extract_ascii.cache_info().currsize == 1
+
 def test_editor_only_entry():
     """Test conversion of an entry with only editors (no authors)."""
     entry = BibTeXEntry(
@@ -731,8 +831,8 @@ def test_bibtex_entry_to_rfcxml_conversion_error(monkeypatch):
         key="errorkey",
         fields={"author": "A", "title": "T", "journal": "J", "year": "2020"}
     )
-    # Patch get_authors to raise an error
-    monkeypatch.setattr(entry, "get_authors", lambda: (_ for _ in ()).throw(ValueError("fail!")))
+    # Patch get_authors to raise an error; entries have slots, so patch the class
+    monkeypatch.setattr(BibTeXEntry, "get_authors", lambda self: (_ for _ in ()).throw(ValueError("fail!")))
     with pytest.raises(ConversionError, match="Conversion failed: fail!"):
         bibtex_entry_to_rfcxml(entry)
 
@@ -743,7 +843,7 @@ def test_bibtex_entry_to_kdrfc_conversion_error(monkeypatch):
         fields={"author": "A", "title": "T", "journal": "J", "year": "2020"}
     )
     # Patch a method used in the conversion to raise an error
-    monkeypatch.setattr(entry, "get_field", lambda x: (_ for _ in ()).throw(ValueError("fail!")))
+    monkeypatch.setattr(BibTeXEntry, "get_field", lambda self, x: (_ for _ in ()).throw(ValueError("fail!")))
     with pytest.raises(ConversionError, match="Conversion failed: fail!"):
         bibtex_entry_to_kdrfc(entry)
 
@@ -791,6 +891,57 @@ def test_bibtex_entry_to_kdrfc_normal_case():
     assert "Normal Case" in yaml
     assert "author:" in yaml
 
+def test_bibtex_entry_to_kdrfc_type_specific_fields():
+    """Entry types sharing a field set get the same type-specific fields."""
+    for entry_type in (BibTeXEntryType.CONFERENCE, BibTeXEntryType.INPROCEEDINGS):
+        entry = BibTeXEntry(
+            entry_type=entry_type,
+            key="paper",
+            fields={"author": "John Doe", "title": "Paper", "booktitle": "Proc. Test", "year": "2020"}
+        )
+        data = yaml.safe_load(bibtex_entry_to_kdrfc(entry))
+        assert data["paper"]["booktitle"] == "Proc. Test"
+    for entry_type in (BibTeXEntryType.TECHREPORT, BibTeXEntryType.REPORT):
+        entry = BibTeXEntry(
+            entry_type=entry_type,
+            key="report",
+            fields={"author": "John Doe", "title": "Report", "institution": "Lab", "year": "2020"}
+        )
+        data = yaml.safe_load(bibtex_entry_to_kdrfc(entry))
+        assert data["report"]["institution"] == "Lab"
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.MISC,
+        key="misc",
+        fields={"author": "John Doe", "title": "Misc", "institution": "Lab"}
+    )
+    data = yaml.safe_load(bibtex_entry_to_kdrfc(entry))
+    assert "institution" not in data["misc"]
+
+def test_bibtex_entry_to_kdrfc_yaml_quoting():
+    """Values YAML would misread unquoted survive a round trip."""
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.ARTICLE,
+        key="2023:quote",
+        fields={
+            "author": "John Doe",
+            "title": 'Yes: "Quoted" # Title',
+            "journal": "null",
+            "volume": "12",
+            "pages": "1--10",
+            "note": "Caf\u00e9 culture",
+            "year": "2023",
+        }
+    )
+    data = yaml.safe_load(bibtex_entry_to_kdrfc(entry))
+    ref = data["2023:quote"]
+    assert ref["title"] == 'Yes: "Quoted" # Title'
+    assert ref["journal"] == "null"
+    assert ref["volume"] == 12
+    assert ref["pages"] == "1--10"
+    assert ref["note"] == "Caf\u00e9 culture"
+    assert ref["date"] == {"year": 2023}
+    assert ref["author"] == [{"ins": "John Doe", "name": "John Doe"}]
+
 def test_author_name_handling():
     """Test handling of author names in various formats."""
     test_cases = [
@@ -833,6 +984,11 @@ def test_author_name_handling():
         {
             "author": "{{John}} {{Doe}} and {{Jane}} {{Smith}}",
             "expected": ["John Doe", "Jane Smith"]
+        },
+        # Braces protecting an " and " inside a name
+        {
+            "author": "{Barnes and Noble} and Doe, Jane",
+            "expected": ["Barnes and Noble", "Jane Doe"]
         }
     ]
 
@@ -264,4 +264,29 @@ def test_kdrfc_invalid_encoding():
     from bibtex2rfcv2.error_handling import InvalidInputError
     bib_path = Path("tests/data/invalid_encoding.bibtex")
     with pytest.raises(InvalidInputError):
-        parse_bibtex(bib_path) 
\ No newline at end of file
+        parse_bibtex(bib_path) 
+
+@pytest.mark.parametrize("value, expected", [
+    ("42", 42),
+    ("-3", -3),
+    ("+5", 5),
+    (" 5 ", 5),
+    ("1_000", 1000),
+    ("12-14", "12-14"),
+    ("Second", "Second"),
+    ("", ""),
+])
+def test_try_convert_to_int(value, expected):
+    """Test that numbers are converted with int() semantics and other values kept."""
+    from bibtex2rfcv2.kdrfc_converter import _try_convert_to_int
+    assert _try_convert_to_int(value) == expected
+
+
+def test_kdrfc_conversion_logs_nothing_at_info(caplog):
+    """Test that converting an entry does not log at INFO level."""
+    import logging
+    from bibtex2rfcv2.kdrfc_converter import bibtex_entry_to_kdrfc
+    entry = parse_bibtex('@misc{test, author="Doe, John", title="Title", year="2023"}')[0]
+    with caplog.at_level(logging.INFO, logger="bibtex2rfcv2.error_handling"):
+        bibtex_entry_to_kdrfc(entry)
+    assert not [r for r in caplog.records if r.name == "bibtex2rfcv2.error_handling"]
@@ -54,6 +54,40 @@ def test_get_authors():
     assert authors[2] == "Bob Johnson"
 
 
+def test_get_authors_cache():
+    """Test that processed authors are cached until the field changes."""
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.MISC,
+        key="cache2023",
+        fields={"author": "Doe, John and Smith, Jane"},
+    )
+    authors = entry.get_authors()
+    assert authors == ["John Doe", "Jane Smith"]
+    authors.append("Someone Else")
+    assert entry.get_authors() == ["John Doe", "Jane Smith"]
+    entry.fields["author"] = "Bob Johnson"
+    assert entry.get_authors() == ["Bob Johnson"]
+    assert entry.get_editors() == []
+
+
+def test_get_names_cache_sees_in_place_edits():
+    """Test that editing a list of names in place invalidates the cache."""
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.MISC,
+        key="cache2023",
+        fields={
+            "author": ["Doe, John"],
+            "editor": [{"name": "Smith, Jane", "ID": "SmithJane"}],
+        },
+    )
+    assert entry.get_authors() == ["John Doe"]
+    assert entry.get_editors() == ["Jane Smith"]
+    entry.fields["author"].append("Johnson, Bob")
+    entry.fields["editor"][0]["name"] = "Roe, Richard"
+    assert entry.get_authors() == ["John Doe", "Bob Johnson"]
+    assert entry.get_editors() == ["Richard Roe"]
+
+
 def test_get_field():
     """Test field access methods."""
     entry = BibTeXEntry(
@@ -129,6 +163,29 @@ def test_missing_field():
     assert "Missing required fields" in str(exc_info.value)
 
 
+def test_deferred_validation():
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.ARTICLE,
+        key="deferred",
+        fields={"year": "23"},
+        validate_on_init=False,
+    )
+    with pytest.raises(InvalidInputError) as exc_info:
+        entry.validate()
+    assert "Invalid year format" in str(exc_info.value)
+
+
+def test_entry_has_no_instance_dict():
+    entry = BibTeXEntry(
+        entry_type=BibTeXEntryType.MISC,
+        key="slots",
+        fields={"title": "Slots"},
+    )
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.extra = "value"
+
+
 def test_field_format():
     with pytest.raises(InvalidInputError) as exc_info:
         BibTeXEntry(
@@ -181,6 +238,16 @@ def test_field_format():
             "{{Smith and Sons}} and Jane Doe",
             ["Smith and Sons", "Jane Doe"],
         ),
+        # "and" inside single braces next to an accented name
+        (
+            '{Smith and Sons} and M{\\"u}ller, Hans',
+            ["Smith and Sons", "Hans Müller"],
+        ),
+        # "and" inside nested braces
+        (
+            "{Smith {and} Sons and Co} and Jane Doe",
+            ["Smith and Sons and Co", "Jane Doe"],
+        ),
     ],
 )
 def test_get_authors(author_field: str, expected_authors: list[str]) -> None:
@@ -208,6 +275,7 @@ def test_get_field_handling() -> None:
     assert entry.get_field("author") == "National Institute of Standards and Technology"
     assert entry.get_field("title") == "Test Title"
     assert entry.get_field("journal") == "Test Journal"
+    assert entry.get_field("volume", 0) == 0
 
 
 def test_required_fields_validation() -> None:
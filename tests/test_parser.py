@@ -4,8 +4,9 @@ from pathlib import Path
 
 import pytest
 
-from bibtex2rfcv2.parser import parse_bibtex
+from bibtex2rfcv2.parser import iter_bibtex, parse_bibtex
 from bibtex2rfcv2.error_handling import InvalidInputError
+from bibtex2rfcv2.models import BibTeXEntryType
 
 
 def test_parse_bibtex_file(sample_bibtex_file: Path) -> None:
@@ -32,6 +33,30 @@ def test_parse_bibtex_content(sample_bibtex_content: str) -> None:
     assert entry.key == "825694"
 
 
+def test_iter_bibtex_yields_entries_in_order() -> None:
+    """Test that iter_bibtex yields the entries parse_bibtex returns."""
+    content = "\n".join(
+        f'@misc{{entry{i}, title="Title {i}", year="2023"}}' for i in range(3)
+    )
+    entries = iter_bibtex(content)
+    assert next(entries).key == "entry0"
+    assert [entry.key for entry in entries] == ["entry1", "entry2"]
+    assert [entry.key for entry in parse_bibtex(content)] == ["entry0", "entry1", "entry2"]
+
+
+def test_parse_entry_types() -> None:
+    """Test that entry types map to the enum case-insensitively."""
+    content = (
+        '@InProceeding{paper, author="John Doe", title="T", booktitle="B", year="2023"}\n'
+        '@weird{skipped, title="T"}\n'
+        '@MISC{note, title="T"}\n'
+    )
+    entries = parse_bibtex(content)
+    assert [entry.key for entry in entries] == ["paper", "note"]
+    assert entries[0].entry_type is BibTeXEntryType.INPROCEEDINGS
+    assert entries[1].entry_type is BibTeXEntryType.MISC
+
+
 def test_parse_empty_file(tmp_path: Path) -> None:
     """Test parsing an empty file."""
     empty_file = tmp_path / "empty.bibtex"
@@ -45,4 +70,65 @@ def test_parse_invalid_file(tmp_path: Path) -> None:
     invalid_file = tmp_path / "invalid.bibtex"
     invalid_file.write_text("This is not BibTeX")
     with pytest.raises(InvalidInputError):
-        parse_bibtex(invalid_file) 
\ No newline at end of file
+        parse_bibtex(invalid_file) 
+
+def test_parse_crlf_file(tmp_path: Path) -> None:
+    """Test that CRLF line endings are read like LF ones."""
+    crlf_file = tmp_path / "crlf.bibtex"
+    crlf_file.write_bytes(b"@misc{note,\r\n  title = {Line one\r\nline two},\r\n  year = {2020}\r\n}\r\n")
+    entries = parse_bibtex(crlf_file)
+    assert entries[0].get_field("title") == "Line one line two"
+
+
+def test_parse_non_utf8_file(tmp_path: Path) -> None:
+    """Test that a file that is not UTF-8 is rejected."""
+    latin1_file = tmp_path / "latin1.bibtex"
+    latin1_file.write_bytes("@misc{note, title = {Café}, year = {2020}}".encode("latin-1"))
+    with pytest.raises(InvalidInputError):
+        parse_bibtex(latin1_file)
+
+
+def test_parse_string_macros() -> None:
+    """Test that month macros are expanded and undefined macros keep their names."""
+    entries = parse_bibtex('@misc{note, title = {T}, month = nov, note = "see " # ack, year = {2020}}')
+    assert entries[0].fields["month"] == "November"
+    assert entries[0].fields["note"] == "see ack"
+
+
+def test_parse_parallel_customization(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that customizing records in a process pool gives the serial result."""
+    from bibtex2rfcv2 import parser
+
+    content = "\n".join(
+        f"@misc{{note{i}, author = {{M{{\\\"u}}ller, J. and Doe, Jane}}, month = nov, year = {{2020}}}}"
+        for i in range(3)
+    )
+    serial = parse_bibtex(content)
+    monkeypatch.setattr(parser, "_PARALLEL_THRESHOLD", 2)
+    monkeypatch.setattr(parser, "_available_cpus", lambda: 2)
+    parallel = parse_bibtex(content, jobs=2)
+    assert [entry.fields for entry in parallel] == [entry.fields for entry in serial]
+    assert parallel[0].fields["month"] == "November"
+
+
+@pytest.mark.parametrize("jobs,daemon", [(1, False), (2, True)])
+def test_parse_stays_serial(monkeypatch: pytest.MonkeyPatch, jobs: int, daemon: bool) -> None:
+    """Test that no pool is started by default or inside a daemonic process."""
+    from bibtex2rfcv2 import parser
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(parser, "_PARALLEL_THRESHOLD", 1)
+    monkeypatch.setattr(parser, "_available_cpus", lambda: 4)
+    monkeypatch.setattr(parser, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(parser.multiprocessing.current_process(), "daemon", daemon, raising=False)
+    entries = parse_bibtex("@misc{a, title = {A}, year = {2020}}\n@misc{b, title = {B}, year = {2021}}", jobs=jobs)
+    assert [entry.key for entry in entries] == ["a", "b"]
+
+
+def test_parse_interns_field_names() -> None:
+    """Test that entries share their field name strings."""
+    entries = parse_bibtex("@misc{a, title = {A}, year = {2020}}\n@misc{b, title = {B}, year = {2021}}")
+    first, second = (next(name for name in entry.fields if name == "title") for entry in entries)
+    assert first is second
@@ -0,0 +1,56 @@
+"""Tests for the BibTeX entry splitting script."""
+
+import importlib.util
+from pathlib import Path
+
+from bibtex2rfcv2.error_handling import InvalidInputError
+from bibtex2rfcv2.parser import parse_bibtex
+
+_SCRIPT = Path(__file__).parent.parent / "scripts" / "split_bibtex_entries.py"
+_spec = importlib.util.spec_from_file_location("split_bibtex_entries", _SCRIPT)
+split_bibtex_entries = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(split_bibtex_entries)
+
+
+def _split(data: bytes) -> list:
+    return list(split_bibtex_entries.iter_entries(data))
+
+
+def test_split_indented_entry():
+    """Test that an entry does not have to start in the first column."""
+    assert _split(b"  @article{a, title={x}}") == [b"@article{a, title={x}}"]
+
+
+def test_split_entries_on_one_line():
+    """Test that two entries on the same line are both found."""
+    assert _split(b"@misc{a, title={x}} @misc{b, title={y}}") == [
+        b"@misc{a, title={x}}",
+        b"@misc{b, title={y}}",
+    ]
+
+
+def test_split_skips_quoted_braces():
+    """Test that a brace inside a quoted value does not end the entry."""
+    entry = b'@misc{a, title="x } y", year={2020}}'
+    assert _split(entry + b"\n@misc{b, title={z}}") == [entry, b"@misc{b, title={z}}"]
+
+
+def test_split_keeps_string_macros():
+    """Test that @string definitions are copied in front of each entry."""
+    data = b'@string{acm = "ACM Press"}\n@misc{a, title={T}, publisher=acm, year={2020}}\n'
+    entries = _split(data)
+    assert entries == [b'@string{acm = "ACM Press"}\n@misc{a, title={T}, publisher=acm, year={2020}}']
+    assert parse_bibtex(entries[0].decode("utf-8"))[0].fields["publisher"] == "ACM Press"
+
+
+def test_split_counts_match_parser(test_data_dir: Path):
+    """Test that every data file splits into as many entries as parse_bibtex finds."""
+    checked = 0
+    for bib_file in sorted(test_data_dir.glob("*.bibtex")):
+        try:
+            expected = len(parse_bibtex(bib_file))
+        except InvalidInputError:
+            continue
+        assert len(_split(bib_file.read_bytes())) == expected, bib_file.name
+        checked += 1
+    assert checked
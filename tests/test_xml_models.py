@@ -78,6 +78,21 @@ def test_front_to_xml():
     assert "</front>" in xml
 
 
+def test_front_write_xml():
+    """Test that front matter written to a stream matches to_xml."""
+    from io import StringIO
+    front = Front(
+        title="Test Title",
+        authors=[Author(fullname="John Doe")],
+        date=Date(year="2023"),
+        abstract="This is a test abstract",
+    )
+    out = StringIO()
+    front.write_xml(out)
+    assert out.getvalue() == front.to_xml()
+    assert out.getvalue().startswith("<front>\n  <title>Test Title</title>\n")
+
+
 def test_reference_to_xml():
     """Test reference XML generation."""
     ref = Reference(
@@ -121,4 +136,21 @@ def test_xml_escaping():
     assert "Test &lt;Title&gt; &amp; More" in xml
     assert "John &amp; Jane" in xml
     assert "Journal &amp; More" in xml
-    assert "Test &lt;Journal&gt;" in xml 
\ No newline at end of file
+    assert "Test &lt;Journal&gt;" in xml 
+
+
+def test_xml_attribute_quote_escaping():
+    """Test that double quotes are escaped inside attribute values."""
+    info = SeriesInfo(name="Journal", value='The "Best" Journal')
+    xml = info.to_xml()
+    assert 'value="The &quot;Best&quot; Journal"' in xml
+    author = Author(fullname='John "JD" Doe')
+    assert 'fullname="John &quot;JD&quot; Doe"' in author.to_xml()
+
+
+def test_author_ascii_fullname():
+    """Test that ASCII variants are kept on the slotted Author."""
+    author = Author(fullname="José Müller", ascii_fullname="Jose Muller")
+    assert author.ascii_fullname == "Jose Muller"
+    assert 'asciiFullname="Jose Muller"' in author.to_xml()
+    assert not hasattr(author, "__dict__")